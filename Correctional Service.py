@@ -131,3 +131,8 @@ Estimated release date (2/3 rule): 2024-08-15
 ### **Execution**:
 - Save this program in a `.py` file.
 - Run the script using a Python interpreter (e.g., `python inmate_release_calculator.py`).
+
+### **Processing a Whole Roster**:
+- For many inmates at once, use `release_roster.py`. It reads a roster CSV or Parquet file with `sentence_years`, `sentence_months`, `sentence_days`, `served_years`, `served_months` and `served_days` columns and computes the 2/3 date, time left and release date for every row in one vectorized pass.
+- All rows share a single reference date, and years and months are counted on the real calendar (leap years, month lengths) instead of 365/30 days.
+- Run it with `python release_roster.py roster.csv --reference-date 2026-01-01 -o releases.csv`.
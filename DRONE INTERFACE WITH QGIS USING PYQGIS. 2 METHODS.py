@@ -57,7 +57,7 @@ QgsMapCanvas().addPoint(point)
 **Improvement and Commented Code:**
 
 ```python
-from qgis.core import QgsPoint, QgsFeature, QgsGeometry, QgsVectorLayer
+from qgis.core import QgsPointXY, QgsFeature, QgsGeometry, QgsVectorLayer
 from qgis.PyQt.QtCore import QVariant
 
 # Get telemetry data
@@ -69,8 +69,8 @@ if telemetry:
 else:
     print("Failed to get telemetry data.")
 
-# Create a QgsPoint object for the drone's location
-drone_point = QgsPoint(telemetry.latitude, telemetry.longitude)
+# Create a QgsPointXY for the drone's location (x = longitude, y = latitude)
+drone_point = QgsPointXY(telemetry.longitude, telemetry.latitude)
 
 # Create a new point layer to visualize the drone's location
 layer = QgsVectorLayer("Point?crs=EPSG:4326", "Drone Flight Path", "memory")
@@ -98,6 +98,7 @@ print("Drone location has been added to QGIS.")
 **Key Improvements:**
 - **Layer Creation**: Instead of directly adding points to the map, I’ve added the point to a `QgsVectorLayer`. This ensures that you can store and manipulate the points as a layer, which is more efficient for larger datasets and provides greater flexibility.
 - **Attributes**: I’ve added attributes for the point (latitude and longitude), which will allow for future data analysis and display in QGIS.
+- **Axis Order**: QGIS points take the x coordinate (longitude) first, so the point is built as `QgsPointXY(longitude, latitude)`. For whole arrays of telemetry, `telemetry_geometry.py` builds the WKB geometries and UTM coordinates in bulk with the same axis order.
 - **Error Checking**: A basic error check has been added to ensure the telemetry data is successfully retrieved before creating the map layer.
 - **Map Layer**: The code now adds a new layer to the QGIS project, making it easier to visualize and manage.
 
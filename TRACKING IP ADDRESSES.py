@@ -101,6 +101,11 @@ You can use third-party tools to scan your system for unknown listening devices
 - Optionally, use third-party tools like **Wireshark**, **TCPView**, or **Process Explorer** for deeper insights.
 
 
+### **On Linux Servers**:
+- The same checks can run continuously on Linux with `connection_monitor.py`. It reads `/proc/net/tcp`, `/proc/net/tcp6`, `/proc/net/udp` and `/proc/net/arp` directly (no `netstat` or `arp` subprocesses) and maps each socket to its process ID.
+- It only reports changes: new listening ports, connections to foreign IP addresses not seen before, and new devices in the ARP table.
+- Run it with `sudo python connection_monitor.py --interval 0.5` so that sockets of every user can be matched to a process.
+
 COUNTERING THE PROBLEM 
 
 
@@ -0,0 +1,273 @@
+"""
+Linux connection and listener monitor.
+
+"TRACKING IP ADDRESSES.py" walks through ``netstat -ano``, ``arp -a`` and
+Task Manager by hand on Windows. On Linux the same information is in
+``/proc``, so this monitor reads it directly, without spawning ``netstat``,
+``ss`` or ``lsof``:
+
+* ``/proc/net/tcp``, ``tcp6``, ``udp`` and ``udp6`` for sockets,
+* ``/proc/net/arp`` for neighbours on the local network,
+* ``/proc/<pid>/fd`` links to map socket inodes to processes.
+
+Each table is read in one bulk read and only re-parsed when its bytes
+changed. The inode-to-PID index is rebuilt at most once per scan, and only
+when a socket shows up whose owner is not already known. Snapshots are diffed
+so only changes are reported:
+
+    python connection_monitor.py --interval 0.5
+
+prints new listeners, connections to foreign IPs not seen before, and new
+ARP neighbours. Sockets owned by other users' processes need root to be
+mapped to a PID.
+"""
+
+import argparse
+import collections
+import os
+import socket
+import time
+
+TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING",
+}
+SOCKET_TABLES = {
+    "tcp": "/proc/net/tcp",
+    "tcp6": "/proc/net/tcp6",
+    "udp": "/proc/net/udp",
+    "udp6": "/proc/net/udp6",
+}
+ARP_TABLE = "/proc/net/arp"
+
+Socket = collections.namedtuple("Socket", "protocol local_ip local_port remote_ip remote_port state uid inode")
+Event = collections.namedtuple("Event", "kind protocol local remote pid process")
+
+
+def _decode_address(text):
+    """
+    Decode a /proc/net address such as ``0100007F:0050``. The IP is stored as
+    32-bit words in host (little-endian) order.
+    """
+    address, port = text.split(":")
+    raw = bytes.fromhex(address)
+    raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    family = socket.AF_INET if len(raw) == 4 else socket.AF_INET6
+    return socket.inet_ntop(family, raw), int(port, 16)
+
+
+def parse_socket_table(data, protocol):
+    """
+    Parse the bytes of a /proc/net/{tcp,udp}[6] table into ``Socket`` tuples.
+    """
+    sockets = []
+    is_udp = protocol.startswith("udp")
+    for line in data.decode("ascii", "replace").splitlines()[1:]:
+        fields = line.split()
+        if len(fields) < 10:
+            continue
+        local_ip, local_port = _decode_address(fields[1])
+        remote_ip, remote_port = _decode_address(fields[2])
+        if is_udp:
+            # A UDP socket without a peer is a bound "listener"
+            state = "LISTEN" if remote_port == 0 else "ESTABLISHED"
+        else:
+            state = TCP_STATES.get(fields[3], fields[3])
+        sockets.append(Socket(protocol, local_ip, local_port, remote_ip, remote_port,
+                              state, int(fields[7]), int(fields[9])))
+    return sockets
+
+
+def parse_arp_table(data):
+    """
+    Parse /proc/net/arp into {ip: (mac, device)} for complete entries.
+    """
+    neighbours = {}
+    for line in data.decode("ascii", "replace").splitlines()[1:]:
+        fields = line.split()
+        # Flags 0x0 means the entry is incomplete
+        if len(fields) >= 6 and fields[2] != "0x0":
+            neighbours[fields[0]] = (fields[3], fields[5])
+    return neighbours
+
+
+def _read(path):
+    try:
+        with open(path, "rb") as table:
+            return table.read()
+    except OSError:
+        return b""
+
+
+def build_inode_index(proc="/proc"):
+    """
+    Map socket inode -> pid by reading every process's fd links once.
+    Processes that exit or deny access mid-scan are skipped.
+    """
+    index = {}
+    for pid in os.listdir(proc):
+        if not pid.isdigit():
+            continue
+        fd_dir = os.path.join(proc, pid, "fd")
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue
+            if target.startswith("socket:["):
+                index[int(target[8:-1])] = int(pid)
+    return index
+
+
+def process_name(pid, proc="/proc"):
+    try:
+        with open(os.path.join(proc, str(pid), "comm")) as comm:
+            return comm.read().strip()
+    except OSError:
+        return None
+
+
+def _is_loopback(ip):
+    return ip.startswith(("127.", "::ffff:127.")) or ip == "::1"
+
+
+class ConnectionMonitor:
+    """
+    Polls /proc and reports changes between snapshots as ``Event`` tuples.
+
+    Event kinds are ``listener`` (a new listening TCP or bound UDP socket),
+    ``foreign_ip`` (an ESTABLISHED connection to a remote IP not seen before)
+    and ``arp`` (a new or changed neighbour in the ARP table). For ``arp``
+    events ``protocol`` holds the interface, ``local`` the neighbour's IP and
+    ``remote`` its MAC address.
+    """
+
+    def __init__(self, include_loopback=False):
+        self.include_loopback = include_loopback
+        self._raw = {}
+        self._parsed = {}
+        self._inode_pid = {}
+        self.listeners = set()
+        self.foreign_ips = set()
+        self.neighbours = {}
+        self._primed = False
+        self._changed = False
+
+    def _table(self, path, parse, *args):
+        """
+        Return the parsed table, re-parsing only when the file's bytes changed.
+        """
+        data = _read(path)
+        if self._raw.get(path) != data:
+            self._raw[path] = data
+            self._parsed[path] = parse(data, *args)
+            self._changed = True
+        return self._parsed[path]
+
+    def snapshot(self):
+        """
+        Return (sockets, neighbours); ``self._changed`` tells whether any
+        table differed from the previous snapshot.
+        """
+        self._changed = False
+        sockets = []
+        for protocol, path in SOCKET_TABLES.items():
+            sockets.extend(self._table(path, parse_socket_table, protocol))
+        return sockets, self._table(ARP_TABLE, parse_arp_table)
+
+    def _owner(self, inode, refreshed):
+        """
+        PID owning ``inode``; the inode index is rebuilt at most once per scan.
+        """
+        if inode not in self._inode_pid and not refreshed[0]:
+            self._inode_pid = build_inode_index()
+            refreshed[0] = True
+        pid = self._inode_pid.get(inode)
+        return pid, process_name(pid) if pid else None
+
+    def poll(self):
+        """
+        Take one snapshot and return the events since the previous one. The
+        first call only records the baseline and returns no events.
+        """
+        sockets, neighbours = self.snapshot()
+        if self._primed and not self._changed:
+            return []
+        events = []
+        refreshed = [False]
+
+        listeners = {}
+        for entry in sockets:
+            if entry.state == "LISTEN":
+                listeners[(entry.protocol, entry.local_ip, entry.local_port)] = entry
+        for key in listeners.keys() - self.listeners:
+            entry = listeners[key]
+            if self._primed and (self.include_loopback or not _is_loopback(entry.local_ip)):
+                pid, name = self._owner(entry.inode, refreshed)
+                events.append(Event("listener", entry.protocol, f"{entry.local_ip}:{entry.local_port}", None, pid, name))
+        self.listeners = set(listeners)
+
+        for entry in sockets:
+            if entry.state != "ESTABLISHED" or entry.remote_ip in self.foreign_ips:
+                continue
+            if not self.include_loopback and _is_loopback(entry.remote_ip):
+                continue
+            self.foreign_ips.add(entry.remote_ip)
+            if self._primed:
+                pid, name = self._owner(entry.inode, refreshed)
+                events.append(Event("foreign_ip", entry.protocol, f"{entry.local_ip}:{entry.local_port}",
+                                    f"{entry.remote_ip}:{entry.remote_port}", pid, name))
+
+        if self._primed:
+            for ip, (mac, device) in neighbours.items():
+                if self.neighbours.get(ip) != (mac, device):
+                    events.append(Event("arp", device, ip, mac, None, None))
+        self.neighbours = neighbours
+
+        self._primed = True
+        return events
+
+    def run(self, interval=0.5, callback=print):
+        """
+        Poll forever, passing each event to ``callback``.
+        """
+        self.poll()
+        while True:
+            started = time.monotonic()
+            for event in self.poll():
+                callback(event)
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def _print_event(event):
+    stamp = time.strftime("%H:%M:%S")
+    owner = f"pid {event.pid} ({event.process})" if event.pid else "pid unknown"
+    if event.kind == "listener":
+        print(f"{stamp} NEW LISTENER   {event.protocol:<5} {event.local:<45} {owner}")
+    elif event.kind == "foreign_ip":
+        print(f"{stamp} NEW FOREIGN IP {event.protocol:<5} {event.local} -> {event.remote}  {owner}")
+    else:
+        print(f"{stamp} ARP NEIGHBOUR  {event.protocol:<5} {event.local} is at {event.remote}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report new listeners and foreign connections from /proc.")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between polls")
+    parser.add_argument("--include-loopback", action="store_true", help="also report loopback-only sockets")
+    args = parser.parse_args()
+
+    monitor = ConnectionMonitor(include_loopback=args.include_loopback)
+    print(f"Watching {len(SOCKET_TABLES)} socket tables and the ARP table every {args.interval}s (Ctrl+C to stop)")
+    try:
+        monitor.run(args.interval, _print_event)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Streaming customer segmentation for large customer tables.
+
+The unsupervised section of Machine_Learning.ipynb fits KMeans, PCA and
+IsolationForest on the whole of ``synthetic_customer_data.csv`` in memory and
+draws a pairplot over every row. ``StreamingSegmenter`` does the same work
+over chunked CSV or Parquet reads, so memory depends on the chunk size rather
+than the row count:
+
+1. one pass fits the ``StandardScaler`` and keeps a fixed-size random sample,
+2. one pass (or more, with ``epochs``) fits ``MiniBatchKMeans`` and
+   ``IncrementalPCA`` with ``partial_fit``,
+3. ``IsolationForest`` is fitted on the sample,
+4. ``score`` streams cluster, anomaly and PCA columns to an output file.
+
+    from customer_segmentation import StreamingSegmenter
+
+    segmenter = StreamingSegmenter().fit("customers.parquet")
+    segmenter.score("customers.parquet", "customer_segments.parquet")
+    sns.pairplot(segmenter.labelled_sample(), hue="Cluster")
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import IncrementalPCA
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+FEATURES = ["AnnualIncome", "SpendingScore"]
+SAMPLE_COLUMNS = ["Age", "AnnualIncome", "SpendingScore"]
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def iter_chunks(path, columns=None, chunksize=100_000, dtype=None):
+    """
+    Yield DataFrames of at most ``chunksize`` rows from a CSV or Parquet file.
+    ``dtype`` is passed to ``pd.read_csv`` to pin CSV column types.
+    """
+    if _is_parquet(path):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize, dtype=dtype)
+
+
+def _stable_schema(table, input_columns):
+    """
+    Schema for the whole output, from the first chunk. CSV chunks infer their
+    types separately, so input columns that are all missing in the first
+    chunk are written as strings; every other column keeps its first-chunk
+    type (``score`` reads CSV integer columns as nullable ``Int64``).
+    """
+    fields = []
+    for field, column in zip(table.schema, table.columns):
+        if field.name in input_columns and column.null_count == len(column):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+class StreamingSegmenter:
+    """
+    Incremental KMeans / PCA / IsolationForest over chunked customer tables.
+    """
+
+    def __init__(self, features=None, n_clusters=4, n_components=2, contamination=0.05,
+                 sample_size=100_000, chunksize=100_000, random_state=42):
+        self.features = list(features or FEATURES)
+        self.chunksize = chunksize
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.scaler = StandardScaler()
+        self.kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state, n_init=3)
+        self.pca = IncrementalPCA(n_components=n_components)
+        self.isolation_forest = IsolationForest(contamination=contamination, random_state=random_state)
+        self.sample = None
+
+    def _chunks(self, path, columns=None):
+        for chunk in iter_chunks(path, columns or self.features, self.chunksize):
+            chunk = chunk.dropna(subset=self.features)
+            if len(chunk):
+                yield chunk
+
+    def _update_sample(self, chunk, rng):
+        """
+        Reservoir sample by random priority: keep the ``sample_size`` rows with
+        the smallest random keys seen so far, which is a uniform sample.
+        """
+        chunk = chunk.assign(_key=rng.random(len(chunk)))
+        sample = chunk if self.sample is None else pd.concat([self.sample, chunk], ignore_index=True)
+        if len(sample) > self.sample_size:
+            keep = np.argpartition(sample["_key"].to_numpy(), self.sample_size)[:self.sample_size]
+            sample = sample.iloc[keep].reset_index(drop=True)
+        self.sample = sample
+
+    def fit(self, path, epochs=1):
+        rng = np.random.default_rng(self.random_state)
+        columns = list(dict.fromkeys(self.features + self._sample_columns(path)))
+        self.sample = None
+        for chunk in self._chunks(path, columns):
+            self.scaler.partial_fit(chunk[self.features].to_numpy(np.float64))
+            self._update_sample(chunk, rng)
+
+        carry = None
+        for _ in range(epochs):
+            for chunk in self._chunks(path):
+                X = self.scaler.transform(chunk[self.features].to_numpy(np.float64))
+                self.kmeans.partial_fit(X)
+                # IncrementalPCA needs at least n_components rows per call
+                if carry is not None:
+                    X, carry = np.vstack([carry, X]), None
+                if len(X) < self.pca.n_components:
+                    carry = X
+                    continue
+                self.pca.partial_fit(X)
+
+        self.sample = self.sample.drop(columns="_key")
+        self.isolation_forest.fit(self.scaler.transform(self.sample[self.features].to_numpy(np.float64)))
+        return self
+
+    def _sample_columns(self, path):
+        if _is_parquet(path):
+            available = pq.ParquetFile(path).schema_arrow.names
+        else:
+            available = pd.read_csv(path, nrows=0).columns
+        return [column for column in SAMPLE_COLUMNS if column in available]
+
+    def transform(self, chunk):
+        """
+        Add Cluster, Anomaly (1 normal, -1 anomaly) and PC1.. columns.
+        """
+        X = self.scaler.transform(chunk[self.features].to_numpy(np.float64))
+        labelled = chunk.assign(
+            Cluster=self.kmeans.predict(X).astype(np.int16),
+            Anomaly=self.isolation_forest.predict(X).astype(np.int8),
+        )
+        components = self.pca.transform(X).astype(np.float32)
+        for number in range(components.shape[1]):
+            labelled[f"PC{number + 1}"] = components[:, number]
+        return labelled
+
+    def _label_chunk(self, chunk):
+        """
+        ``transform`` for a chunk that may have missing features: those rows
+        keep their input values and get null labels.
+        """
+        valid = chunk[self.features].notna().all(axis=1).to_numpy()
+        labelled = chunk.assign(
+            Cluster=pd.Series(pd.NA, index=chunk.index, dtype="Int16"),
+            Anomaly=pd.Series(pd.NA, index=chunk.index, dtype="Int8"),
+        )
+        for column in self._label_columns()[2:]:
+            labelled[column] = np.full(len(chunk), np.nan, dtype=np.float32)
+        if valid.any():
+            labels = self.transform(chunk[valid])
+            for column in self._label_columns():
+                labelled.loc[valid, column] = labels[column].to_numpy()
+        return labelled
+
+    def _label_columns(self):
+        return ["Cluster", "Anomaly"] + [f"PC{number + 1}" for number in range(self.pca.n_components_)]
+
+    def score(self, path, output_path, columns=None, dtype=None):
+        """
+        Stream labels for every row of ``path`` into ``output_path`` (Parquet
+        or CSV by extension). Rows with a missing feature are written with
+        null Cluster, Anomaly and PC values. ``columns`` selects the input
+        columns to carry through (the features are always read); by default
+        the whole row is kept. Existing label columns are replaced. ``dtype``
+        pins CSV column types when a column's type differs between chunks in
+        ways that cannot be widened (e.g. numeric at first, text later).
+        Returns the row count.
+        """
+        written = 0
+        writer = None
+        try:
+            # Pin the features to float64 so an all-missing chunk reads as numbers
+            dtype = {**dict.fromkeys(self.features, np.float64), **(dtype or {})}
+            if columns is not None:
+                columns = list(dict.fromkeys(list(columns) + self.features))
+            if not _is_parquet(path):
+                # Integer columns read as nullable Int64 so a chunk with a gap
+                # does not turn them into float (which loses ids above 2**53)
+                head = pd.read_csv(path, usecols=columns, nrows=self.chunksize, dtype=dtype)
+                integers = head.select_dtypes("integer").columns
+                dtype = {**dict.fromkeys(integers, "Int64"), **dtype}
+            for chunk in iter_chunks(path, columns, self.chunksize, dtype):
+                if not len(chunk):
+                    continue
+                labelled = self._label_chunk(chunk)
+                if _is_parquet(output_path):
+                    table = pa.Table.from_pandas(labelled, preserve_index=False)
+                    if writer is None:
+                        schema = _stable_schema(table, set(chunk.columns) - set(self.features) - set(self._label_columns()))
+                        writer = pq.ParquetWriter(output_path, schema)
+                    writer.write_table(table.cast(writer.schema))
+                else:
+                    labelled.to_csv(output_path, mode="a" if written else "w", header=not written, index=False)
+                written += len(labelled)
+        finally:
+            if writer is not None:
+                writer.close()
+        return written
+
+    def labelled_sample(self, size=None):
+        """
+        The fitted sample with Cluster, Anomaly and PC columns, optionally cut
+        down to ``size`` rows, for scatter and pair plots.
+        """
+        sample = self.sample
+        if size is not None and size < len(sample):
+            sample = sample.sample(size, random_state=self.random_state)
+        return self.transform(sample)
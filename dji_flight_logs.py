@@ -0,0 +1,322 @@
+"""
+Bulk DJI flight-log parser.
+
+Method 2 of the drone guide imports one flight log at a time through the DJI
+plugin. This module parses DJI / AirData CSV and delimited TXT exports with the
+Arrow CSV reader, so every flight is read straight into typed columns without
+building a Python object per row. Many logs are parsed in parallel and written
+to a single GeoParquet dataset partitioned by flight date and aircraft:
+
+    from dji_flight_logs import write_flight_archive, open_flight_archive
+
+    write_flight_archive(glob.glob("logs/*.csv"), "flight_archive")
+    archive = open_flight_archive("flight_archive")
+
+QGIS opens the individual Parquet files directly, and geopandas can read the
+whole archive (or a filtered part of it) with ``geopandas.read_parquet``.
+"""
+
+import collections
+import concurrent.futures
+import json
+import os
+import uuid
+import warnings
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+
+from telemetry_geometry import points_to_wkb_array, telemetry_xy
+
+FEET_TO_METRES = 0.3048
+MPH_TO_MS = 0.44704
+KMH_TO_MS = 1 / 3.6
+
+# Column names used by the common DJI exports, with the factor that converts
+# each one to SI units. The first name found in a log wins.
+COLUMN_ALIASES = {
+    "time": (
+        ("datetime(utc)", None),
+        ("CUSTOM.updateTime [local]", None),
+        ("GPS:dateTimeStamp", None),
+        ("time", None),
+    ),
+    "latitude": (
+        ("latitude", None),
+        ("OSD.latitude", None),
+        ("GPS:Lat", None),
+        ("Latitude", None),
+    ),
+    "longitude": (
+        ("longitude", None),
+        ("OSD.longitude", None),
+        ("GPS:Long", None),
+        ("Longitude", None),
+    ),
+    "altitude": (
+        ("altitude(m)", 1.0),
+        ("altitude(feet)", FEET_TO_METRES),
+        ("OSD.altitude [m]", 1.0),
+        ("OSD.altitude [ft]", FEET_TO_METRES),
+        ("OSD.height [m]", 1.0),
+        ("OSD.height [ft]", FEET_TO_METRES),
+        ("altitude", 1.0),
+    ),
+    "speed": (
+        ("speed(m/s)", 1.0),
+        ("speed(mph)", MPH_TO_MS),
+        ("speed(km/h)", KMH_TO_MS),
+        ("OSD.hSpeed [m/s]", 1.0),
+        ("OSD.hSpeed [MPH]", MPH_TO_MS),
+        ("OSD.hSpeed [km/h]", KMH_TO_MS),
+        ("speed", 1.0),
+    ),
+}
+AIRCRAFT_COLUMNS = ("RECOVER.aircraftName", "aircraftName", "aircraft")
+
+# Formats for the whole-second part of a time; fractional seconds such as
+# "10:00:00.100" are split off first because Arrow's strptime has no %f.
+TIMESTAMP_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y/%m/%d %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %I:%M:%S %p",
+]
+FRACTION_PATTERN = r"(:\d{2})\.(\d+)"
+
+TELEMETRY_SCHEMA = pa.schema([
+    ("flight_id", pa.string()),
+    ("time", pa.timestamp("ms")),
+    ("latitude", pa.float64()),
+    ("longitude", pa.float64()),
+    ("altitude", pa.float32()),
+    ("speed", pa.float32()),
+    ("geometry", pa.binary()),
+    ("date", pa.string()),
+    ("aircraft", pa.string()),
+])
+PARTITION_SCHEMA = pa.schema([("date", pa.string()), ("aircraft", pa.string())])
+
+GEO_METADATA = {
+    "version": "1.0.0",
+    "primary_column": "geometry",
+    # No "crs" key: GeoParquet then means OGC:CRS84, i.e. longitude/latitude
+    "columns": {"geometry": {"encoding": "WKB", "geometry_types": ["Point"]}},
+}
+
+
+def _sniff_header(path):
+    """
+    Return the delimiter and column names from the first line of a log.
+    """
+    with open(path, newline="", encoding="utf-8", errors="replace") as log_file:
+        header = log_file.readline().lstrip("\ufeff").rstrip("\r\n")
+    delimiter = max((",", "\t", ";", "|"), key=header.count)
+    return delimiter, header.split(delimiter)
+
+
+def _resolve_columns(header):
+    """
+    Map each telemetry field to (column name in this log, unit factor).
+    """
+    present = {name.strip(): name for name in header}
+    resolved = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for name, factor in aliases:
+            if name in present:
+                resolved[field] = (present[name], factor)
+                break
+    missing = {"time", "latitude", "longitude"} - resolved.keys()
+    if missing:
+        raise ValueError(f"Flight log is missing required columns: {sorted(missing)}")
+    return resolved
+
+
+def parse_times(text):
+    """
+    Parse a string column of log times into ``timestamp("ms")``, trying each
+    of ``TIMESTAMP_FORMATS`` in turn. Sub-second digits are kept to the
+    millisecond; values no format matches become null.
+    """
+    whole = pc.replace_substring_regex(text, FRACTION_PATTERN, r"\1")
+    fraction = pc.extract_regex(text, r":\d{2}\.(?P<digits>\d+)").field("digits")
+    millis = pc.cast(pc.utf8_rpad(pc.utf8_slice_codeunits(fraction, 0, 3), 3, "0"), pa.int64())
+    millis = pc.cast(pc.fill_null(millis, 0), pa.duration("ms"))
+
+    parsed = pa.nulls(len(text), pa.timestamp("ms"))
+    for time_format in TIMESTAMP_FORMATS:
+        parsed = pc.coalesce(parsed, pc.strptime(whole, time_format, "ms", error_is_null=True))
+        if parsed.null_count == text.null_count:
+            break
+    return pc.add(parsed, millis)
+
+
+def parse_flight_log(path, aircraft=None):
+    """
+    Parse one DJI CSV/TXT flight log into an Arrow table with
+    ``TELEMETRY_SCHEMA``. Altitude is in metres and speed in m/s.
+
+    Fixes recorded before GPS lock (missing or 0/0 coordinates), corrupt
+    fixes with a latitude outside [-90, 90] and rows whose time matches none
+    of ``TIMESTAMP_FORMATS`` are dropped.
+    ``aircraft`` is used when the log itself does not name the aircraft.
+    """
+    delimiter, header = _sniff_header(path)
+    resolved = _resolve_columns(header)
+    aircraft_column = next((name for name in header if name.strip() in AIRCRAFT_COLUMNS), None)
+
+    column_types = {resolved["time"][0]: pa.string()}
+    for field in ("latitude", "longitude", "altitude", "speed"):
+        if field in resolved:
+            column_types[resolved[field][0]] = pa.float64()
+    include_columns = list(column_types)
+    if aircraft_column:
+        include_columns.append(aircraft_column)
+        column_types[aircraft_column] = pa.string()
+
+    raw = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=include_columns,
+            column_types=column_types,
+            strings_can_be_null=True,
+        ),
+    )
+
+    time_column = raw.column_names.index(resolved["time"][0])
+    raw = raw.set_column(time_column, resolved["time"][0], parse_times(raw[time_column].combine_chunks()))
+    time = raw[resolved["time"][0]]
+    latitude = raw[resolved["latitude"][0]]
+    longitude = raw[resolved["longitude"][0]]
+    valid = pc.and_(
+        pc.and_(pc.is_valid(time), pc.and_(pc.is_valid(latitude), pc.is_valid(longitude))),
+        pc.and_(
+            pc.or_(pc.not_equal(latitude, 0.0), pc.not_equal(longitude, 0.0)),
+            pc.less_equal(pc.abs(latitude), 90.0),
+        ),
+    )
+    raw = raw.filter(valid)
+    raw = raw.take(pc.sort_indices(raw[resolved["time"][0]]))
+
+    count = raw.num_rows
+    columns = {
+        "time": raw[resolved["time"][0]].combine_chunks(),
+        "latitude": raw[resolved["latitude"][0]].combine_chunks(),
+        "longitude": raw[resolved["longitude"][0]].combine_chunks(),
+    }
+    for field in ("altitude", "speed"):
+        if field in resolved:
+            name, factor = resolved[field]
+            values = pc.multiply(raw[name].combine_chunks(), factor)
+        else:
+            values = pa.nulls(count, pa.float64())
+        columns[field] = pc.cast(values, pa.float32())
+
+    if aircraft_column and count:
+        names = pc.drop_null(raw[aircraft_column])
+        if len(names):
+            aircraft = names[0].as_py()
+    aircraft = (aircraft or "unknown").strip().replace("/", "-") or "unknown"
+    date = columns["time"][0].as_py().strftime("%Y-%m-%d") if count else "unknown"
+    flight_id = os.path.splitext(os.path.basename(path))[0]
+
+    x, y = telemetry_xy(
+        columns["latitude"].to_numpy(zero_copy_only=False),
+        columns["longitude"].to_numpy(zero_copy_only=False),
+    )
+    geometry = points_to_wkb_array(x, y)
+    return pa.table(
+        [
+            pa.repeat(pa.scalar(flight_id), count),
+            columns["time"],
+            columns["latitude"],
+            columns["longitude"],
+            columns["altitude"],
+            columns["speed"],
+            geometry,
+            pa.repeat(pa.scalar(date), count),
+            pa.repeat(pa.scalar(aircraft), count),
+        ],
+        schema=TELEMETRY_SCHEMA,
+    )
+
+
+def _parse_or_error(path, aircraft=None):
+    try:
+        return parse_flight_log(path, aircraft), None
+    except (OSError, ValueError, pa.ArrowException) as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def parse_flight_logs(paths, aircraft=None, workers=None):
+    """
+    Parse many logs across ``workers`` processes, yielding one table per log
+    in input order. A log that cannot be read or parsed is skipped with a
+    warning naming the file, so one bad export does not stop the batch.
+
+    At most two logs per worker are in flight, so finished tables waiting
+    for the consumer stay bounded however many paths are given.
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = collections.deque()
+
+    def finished():
+        path, future = pending.popleft()
+        table, error = future.result()
+        if error is not None:
+            warnings.warn(f"Skipping flight log {path}: {error}")
+        return table
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in paths:
+            if len(pending) >= 2 * workers:
+                table = finished()
+                if table is not None:
+                    yield table
+            pending.append((path, pool.submit(_parse_or_error, path, aircraft)))
+        while pending:
+            table = finished()
+            if table is not None:
+                yield table
+
+
+def write_flight_archive(paths, archive_path, aircraft=None, workers=None):
+    """
+    Parse ``paths`` in parallel and append them to the GeoParquet archive at
+    ``archive_path``, partitioned as ``date=YYYY-MM-DD/aircraft=NAME``.
+
+    Tables are streamed to disk as workers finish, so the whole batch is never
+    held in memory at once. Returns the number of fixes written.
+    """
+    schema = TELEMETRY_SCHEMA.with_metadata({"geo": json.dumps(GEO_METADATA)})
+    written = 0
+
+    def batches():
+        nonlocal written
+        for table in parse_flight_logs(paths, aircraft=aircraft, workers=workers):
+            written += table.num_rows
+            yield from table.replace_schema_metadata(schema.metadata).to_batches()
+
+    ds.write_dataset(
+        batches(),
+        archive_path,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return written
+
+
+def open_flight_archive(archive_path):
+    """
+    Open the archive lazily; filters on ``date`` and ``aircraft`` only touch
+    the matching partitions.
+    """
+    return ds.dataset(archive_path, format="parquet", partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"))
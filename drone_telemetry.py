@@ -0,0 +1,269 @@
+"""
+Streaming drone telemetry into one persistent QGIS layer.
+
+Method 1 of the drone guide creates a new memory layer and repaints the map
+canvas for every telemetry point. Here a reader thread pushes samples into a
+ring buffer, and a QTimer on the GUI thread drains the buffer at a fixed frame
+rate and appends the whole batch with a single ``addFeatures`` call.
+
+Usage inside the QGIS Python console:
+
+    from drone_telemetry import LogReplayer, TelemetryRingBuffer, TelemetryReader, TelemetryLayerFeeder
+
+    buffer = TelemetryRingBuffer()
+    reader = TelemetryReader(LogReplayer("flight_2024_05_01.csv"), buffer)
+    feeder = TelemetryLayerFeeder(buffer, canvas=iface.mapCanvas(), fps=5)
+    reader.start()
+    feeder.start()
+
+Swap ``LogReplayer`` for ``dji_sdk.get_telemetry`` to follow a live drone.
+"""
+
+import collections
+import csv
+import threading
+import time
+
+from telemetry_geometry import points_to_wkb, qgs_geometries, telemetry_xy, valid_latitude
+
+TELEMETRY_FIELDS = ("time", "latitude", "longitude", "altitude", "speed")
+
+
+class TelemetrySample(collections.namedtuple("TelemetrySample", TELEMETRY_FIELDS)):
+    """One telemetry fix. ``time`` is seconds since the epoch."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_telemetry(cls, telemetry):
+        """
+        Build a sample from any object exposing latitude/longitude attributes
+        (for example the result of ``dji_sdk.get_telemetry()``).
+        """
+        return cls(
+            float(getattr(telemetry, "time", None) or time.time()),
+            float(telemetry.latitude),
+            float(telemetry.longitude),
+            float(getattr(telemetry, "altitude", 0.0) or 0.0),
+            float(getattr(telemetry, "speed", 0.0) or 0.0),
+        )
+
+
+class TelemetryRingBuffer:
+    """
+    Fixed-size, thread-safe buffer between the telemetry reader and the map.
+
+    When the map falls behind, the oldest samples are overwritten rather than
+    letting memory grow; ``dropped`` counts how many were lost.
+    """
+
+    def __init__(self, capacity=4096):
+        self._samples = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._samples)
+
+    def push(self, sample):
+        with self._lock:
+            if len(self._samples) == self._samples.maxlen:
+                self.dropped += 1
+            self._samples.append(sample)
+
+    def drain(self, max_items=None):
+        """
+        Remove and return up to ``max_items`` samples, oldest first.
+        """
+        with self._lock:
+            count = len(self._samples)
+            if max_items is not None:
+                count = min(count, max_items)
+            return [self._samples.popleft() for _ in range(count)]
+
+
+class LogReplayer:
+    """
+    Replays a recorded telemetry CSV so the pipeline can be tested without a
+    drone. The CSV needs the columns in ``TELEMETRY_FIELDS``.
+
+    Samples are released with their original spacing divided by ``speed``;
+    ``speed=0`` replays as fast as possible.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self._iterator = None
+
+    def read_samples(self):
+        with open(self.path, newline="") as log_file:
+            for row in csv.DictReader(log_file):
+                yield TelemetrySample(*(float(row[field] or 0.0) for field in TELEMETRY_FIELDS))
+
+    def __iter__(self):
+        while True:
+            previous_time = None
+            started = time.monotonic()
+            elapsed = 0.0
+            for sample in self.read_samples():
+                if previous_time is not None and self.speed:
+                    elapsed += (sample.time - previous_time) / self.speed
+                    delay = started + elapsed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                previous_time = sample.time
+                yield sample
+            if not self.loop:
+                return
+
+    def get_telemetry(self):
+        """
+        Drop-in replacement for ``dji_sdk.get_telemetry``; returns ``None``
+        once the log is exhausted.
+        """
+        if self._iterator is None:
+            self._iterator = iter(self)
+        return next(self._iterator, None)
+
+
+class TelemetryReader(threading.Thread):
+    """
+    Background thread that pulls telemetry from ``source`` into a ring buffer.
+
+    ``source`` is either an iterable of samples (such as ``LogReplayer``) or a
+    callable polled at ``poll_hz`` (such as ``dji_sdk.get_telemetry``). The
+    reader never touches QGIS objects, so it is safe off the GUI thread.
+    """
+
+    def __init__(self, source, buffer, poll_hz=50.0):
+        super().__init__(daemon=True)
+        self.source = source
+        self.buffer = buffer
+        self.poll_interval = 1.0 / poll_hz
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        if callable(self.source):
+            self._poll()
+        else:
+            for item in self.source:
+                if self._stop_event.is_set():
+                    break
+                self.buffer.push(self._to_sample(item))
+
+    def _poll(self):
+        while not self._stop_event.wait(self.poll_interval):
+            telemetry = self.source()
+            if telemetry is not None:
+                self.buffer.push(self._to_sample(telemetry))
+
+    @staticmethod
+    def _to_sample(item):
+        if isinstance(item, TelemetrySample):
+            return item
+        return TelemetrySample.from_telemetry(item)
+
+
+class TelemetryLayerFeeder:
+    """
+    Appends buffered telemetry to one persistent point layer.
+
+    ``flush`` runs on a QTimer at ``fps``, so the canvas repaints at most
+    ``fps`` times a second no matter how fast telemetry arrives. Each flush
+    adds at most ``batch_size`` features in one ``addFeatures`` call. Fixes
+    with a latitude outside [-90, 90] are dropped and counted in ``rejected``.
+    """
+
+    def __init__(self, buffer, layer=None, canvas=None, fps=5, batch_size=2000):
+        self.buffer = buffer
+        self.layer = layer if layer is not None else self.create_layer()
+        self.canvas = canvas
+        self.fps = fps
+        self.batch_size = batch_size
+        self.feature_count = 0
+        self.rejected = 0
+        self._timer = None
+
+    @staticmethod
+    def create_layer(name="Drone Flight Path"):
+        """
+        Create the memory layer and add it to the project once.
+        """
+        from qgis.core import QgsField, QgsProject, QgsVectorLayer
+        from qgis.PyQt.QtCore import QVariant
+
+        layer = QgsVectorLayer("Point?crs=EPSG:4326", name, "memory")
+        layer.dataProvider().addAttributes([
+            QgsField("ID", QVariant.Int),
+            QgsField("Time", QVariant.Double),
+            QgsField("Lat", QVariant.Double),
+            QgsField("Lon", QVariant.Double),
+            QgsField("Alt", QVariant.Double),
+            QgsField("Speed", QVariant.Double),
+        ])
+        layer.updateFields()
+        QgsProject.instance().addMapLayer(layer)
+        return layer
+
+    def start(self):
+        from qgis.PyQt.QtCore import QTimer
+
+        self._timer = QTimer()
+        self._timer.setInterval(int(1000 / self.fps))
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        # Write whatever arrived after the last tick
+        pending = len(self.buffer)
+        while pending > 0:
+            drained = self.flush()
+            if not drained:
+                break
+            pending -= drained
+
+    def flush(self):
+        """
+        Move one batch from the buffer into the layer and repaint once.
+        Returns the number of samples taken from the buffer.
+        """
+        drained = self.buffer.drain(self.batch_size)
+        if not drained:
+            return 0
+        keep = valid_latitude([sample.latitude for sample in drained])
+        samples = [sample for sample, ok in zip(drained, keep) if ok]
+        self.rejected += len(drained) - len(samples)
+        if not samples:
+            return len(drained)
+
+        from qgis.core import QgsFeature
+
+        x, y = telemetry_xy([sample.latitude for sample in samples], [sample.longitude for sample in samples])
+        geometries = qgs_geometries(points_to_wkb(x, y))
+        fields = self.layer.fields()
+        features = []
+        for sample, geometry in zip(samples, geometries):
+            self.feature_count += 1
+            feature = QgsFeature(fields)
+            feature.setGeometry(geometry)
+            feature.setAttributes([
+                self.feature_count, sample.time, sample.latitude,
+                sample.longitude, sample.altitude, sample.speed,
+            ])
+            features.append(feature)
+
+        self.layer.dataProvider().addFeatures(features)
+        self.layer.updateExtents()
+        if self.canvas is not None:
+            self.canvas.refresh()
+        else:
+            self.layer.triggerRepaint()
+        return len(drained)
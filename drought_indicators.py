@@ -0,0 +1,133 @@
+"""
+Gridded drought indicators for the Savanna zones.
+
+Data_ANALYSIS.ipynb plots zone averages of SPEI, NDVI, VCI, VHI and TCI that
+were computed elsewhere. This module computes them from raster stacks:
+
+    VCI = 100 * (NDVI - NDVImin) / (NDVImax - NDVImin)
+    TCI = 100 * (LSTmax - LST) / (LSTmax - LSTmin)
+    VHI = alpha * VCI + (1 - alpha) * TCI
+
+with the minimum and maximum taken per pixel over the whole record (per
+calendar month by default). Stacks are opened as dask-backed xarray objects,
+so every step runs chunk by chunk and multi-decade stacks are never loaded
+into memory at once. Results go to a Zarr store holding the per-pixel cube and
+a ``zonal`` group of yearly zone means:
+
+    from drought_indicators import open_stack, build_indicator_cube, read_zonal_means
+
+    ndvi = open_stack("ndvi/*.nc", "NDVI")
+    lst = open_stack("lst/*.nc", "LST")
+    build_indicator_cube(ndvi, lst, zones, {1: "Guinea", 2: "Sudan", 3: "Sahel"}, "indicators.zarr")
+    df_processed = read_zonal_means("indicators.zarr")   # SPEI_Guinea, NDVI_Sudan, ...
+
+``zones`` is an integer raster on the same y/x grid as the stacks.
+"""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+INDICATORS = ["SPEI", "NDVI", "VCI", "VHI", "TCI"]
+DEFAULT_CHUNKS = {"time": 12, "y": 512, "x": 512}
+
+
+def open_stack(paths, variable, chunks=None):
+    """
+    Open a NetCDF (or other xarray-readable) time series lazily as a dask
+    array with dims (time, y, x).
+    """
+    dataset = xr.open_mfdataset(paths, combine="by_coords", chunks=chunks or DEFAULT_CHUNKS, parallel=True)
+    return dataset[variable]
+
+
+def _climatology_bounds(stack, by_month):
+    """
+    Per-pixel minimum and maximum, broadcast back onto the time axis.
+    """
+    if not by_month:
+        return stack.min("time"), stack.max("time")
+    month = stack["time"].dt.month
+    low = stack.groupby(month).min("time").sel(month=month).drop_vars("month")
+    high = stack.groupby(month).max("time").sel(month=month).drop_vars("month")
+    return low, high
+
+
+def vegetation_condition_index(ndvi, by_month=True):
+    low, high = _climatology_bounds(ndvi, by_month)
+    vci = 100 * (ndvi - low) / (high - low)
+    return vci.where(high > low).astype(np.float32).rename("VCI")
+
+
+def temperature_condition_index(lst, by_month=True):
+    low, high = _climatology_bounds(lst, by_month)
+    tci = 100 * (high - lst) / (high - low)
+    return tci.where(high > low).astype(np.float32).rename("TCI")
+
+
+def compute_indicators(ndvi, lst, spei=None, alpha=0.5, by_month=True):
+    """
+    Build a lazy Dataset with NDVI, VCI, TCI, VHI (and SPEI when given) per
+    pixel. Nothing is computed until the result is written or loaded.
+    """
+    vci = vegetation_condition_index(ndvi, by_month)
+    tci = temperature_condition_index(lst, by_month)
+    cube = xr.Dataset({
+        "NDVI": ndvi.astype(np.float32),
+        "VCI": vci,
+        "TCI": tci,
+        "VHI": (alpha * vci + (1 - alpha) * tci).astype(np.float32),
+    })
+    if spei is not None:
+        cube["SPEI"] = spei.astype(np.float32)
+    return cube
+
+
+def zonal_means(cube, zones, zone_names, freq="YS"):
+    """
+    Mean of every indicator over each zone, resampled to ``freq``.
+
+    Returns a Dataset with dims (year, zone) when ``freq`` is yearly, else
+    (time, zone).
+    """
+    zones = zones.load()
+    per_zone = [
+        cube.where(zones == code).mean(("y", "x")).resample(time=freq).mean()
+        for code in zone_names
+    ]
+    means = xr.concat(per_zone, dim=pd.Index(list(zone_names.values()), name="zone"))
+    if freq.startswith(("Y", "A")):
+        means = means.assign_coords(year=("time", means["time"].dt.year.values)).swap_dims(time="year")
+        means = means.drop_vars("time")
+    return means
+
+
+def build_indicator_cube(ndvi, lst, zones, zone_names, store, spei=None, alpha=0.5,
+                         by_month=True, chunks=None):
+    """
+    Compute the indicator cube chunk by chunk and write it to the Zarr
+    ``store``, then add the yearly zone means as the ``zonal`` group.
+
+    The zone means are computed from the written cube, so the indicators are
+    not evaluated twice.
+    """
+    cube = compute_indicators(ndvi, lst, spei=spei, alpha=alpha, by_month=by_month)
+    cube = cube.chunk(chunks or DEFAULT_CHUNKS)
+    for variable in cube.data_vars.values():
+        variable.encoding.clear()
+    cube.to_zarr(store, mode="w", consolidated=True)
+
+    written = xr.open_zarr(store, consolidated=True)
+    zonal_means(written, zones, zone_names).to_zarr(store, group="zonal", mode="w", consolidated=True)
+    return written
+
+
+def read_zonal_means(store):
+    """
+    Read the yearly zone means in the notebook's wide layout: a ``Year``
+    column plus one ``{indicator}_{zone}`` column per series.
+    """
+    zonal = xr.open_zarr(store, group="zonal", consolidated=True)
+    wide = zonal.to_dataframe().unstack("zone")
+    wide.columns = [f"{indicator}_{zone}" for indicator, zone in wide.columns]
+    return wide.rename_axis("Year").reset_index()
@@ -0,0 +1,147 @@
+"""
+Correlation and lag analysis between drought indicators and crop yields.
+
+Data_ANALYSIS.ipynb merges ``df_processed`` and ``df_crops`` on Year and draws
+one correlation heatmap. Here both tidy tables (Year, Zone, Variable, Value,
+as returned by ``savanna_loader``) are turned into dense arrays indexed by
+(variable, zone, year). Every indicator x crop x zone x lag combination is
+then evaluated in one broadcast array operation:
+
+    from drought_yield_analysis import lagged_correlations, rolling_correlations
+
+    lags = lagged_correlations(indicators, crops, max_lag=2)
+    rolling = rolling_correlations(indicators, crops, window=10)
+
+A lag of ``k`` pairs the indicator in year ``t - k`` with the yield in year
+``t``. Missing years are ignored pairwise, like ``DataFrame.corr``.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def to_cube(tidy, zones=None, years=None):
+    """
+    Pivot a tidy table into a float64 array of shape (variable, zone, year),
+    NaN where a value is missing. Returns (cube, variables, zones, years).
+    """
+    variables = pd.Index(pd.unique(tidy["Variable"].astype(str)))
+    zones = pd.Index(zones if zones is not None else pd.unique(tidy["Zone"].astype(str)))
+    years = pd.Index(years if years is not None else np.sort(pd.unique(tidy["Year"])))
+
+    tidy = tidy[tidy["Zone"].astype(str).isin(zones) & tidy["Year"].isin(years)]
+    cube = np.full((len(variables), len(zones), len(years)), np.nan)
+    cube[
+        variables.get_indexer(tidy["Variable"].astype(str)),
+        zones.get_indexer(tidy["Zone"].astype(str)),
+        years.get_indexer(tidy["Year"]),
+    ] = tidy["Value"].to_numpy(dtype=np.float64)
+    return cube, variables, zones, years
+
+
+def _aligned_cubes(indicators, crops):
+    zones = [zone for zone in pd.unique(indicators["Zone"].astype(str))
+             if zone in set(crops["Zone"].astype(str))]
+    years = np.arange(min(indicators["Year"].min(), crops["Year"].min()),
+                      max(indicators["Year"].max(), crops["Year"].max()) + 1)
+    x, indicator_names, zones, years = to_cube(indicators, zones, years)
+    y, crop_names, _, _ = to_cube(crops, zones, years)
+    return x, y, indicator_names, crop_names, zones, years
+
+
+def _lagged(x, max_lag):
+    """
+    Stack of the indicator cube shifted forward by 0..max_lag years along the
+    last axis: shape (lag, variable, zone, year).
+    """
+    lagged = np.full((max_lag + 1,) + x.shape, np.nan)
+    for lag in range(max_lag + 1):
+        lagged[lag, ..., lag:] = x[..., :x.shape[-1] - lag]
+    return lagged
+
+
+def pairwise_stats(x, y, min_periods=3):
+    """
+    Pearson r and least-squares fit of ``y`` on ``x`` along the last axis,
+    ignoring positions where either is NaN. ``x`` and ``y`` broadcast.
+
+    Returns a dict of arrays: n, r, slope, intercept, r2 and t (the t
+    statistic of r with n - 2 degrees of freedom). Results with fewer than
+    ``min_periods`` pairs are NaN.
+    """
+    x, y = np.broadcast_arrays(x, y)
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = np.where(mask, x, 0).sum(axis=-1) / n
+        y_mean = np.where(mask, y, 0).sum(axis=-1) / n
+        dx = np.where(mask, x - x_mean[..., None], 0)
+        dy = np.where(mask, y - y_mean[..., None], 0)
+        sxx = (dx * dx).sum(axis=-1)
+        syy = (dy * dy).sum(axis=-1)
+        sxy = (dx * dy).sum(axis=-1)
+        r = sxy / np.sqrt(sxx * syy)
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+    too_few = n < min_periods
+    stats = {"n": n, "r": r, "slope": slope, "intercept": intercept, "r2": r * r, "t": t}
+    for name in ("r", "slope", "intercept", "r2", "t"):
+        stats[name] = np.where(too_few, np.nan, stats[name])
+    return stats
+
+
+def lagged_correlations(indicators, crops, max_lag=2, min_periods=3):
+    """
+    Correlation and simple regression of every crop yield on every drought
+    indicator, per zone, for lags 0..max_lag years.
+
+    Returns a long DataFrame with columns Indicator, Crop, Zone, Lag, N, R,
+    R2, Slope, Intercept and T.
+    """
+    x, y, indicator_names, crop_names, zones, _ = _aligned_cubes(indicators, crops)
+    # (lag, indicator, 1, zone, year) against (1, 1, crop, zone, year)
+    stats = pairwise_stats(_lagged(x, max_lag)[:, :, None], y[None, None], min_periods)
+
+    lag, indicator, crop, zone = np.indices(stats["r"].shape).reshape(4, -1)
+    return pd.DataFrame({
+        "Indicator": pd.Categorical.from_codes(indicator, indicator_names),
+        "Crop": pd.Categorical.from_codes(crop, crop_names),
+        "Zone": pd.Categorical.from_codes(zone, zones),
+        "Lag": lag,
+        "N": stats["n"].ravel(),
+        "R": stats["r"].ravel(),
+        "R2": stats["r2"].ravel(),
+        "Slope": stats["slope"].ravel(),
+        "Intercept": stats["intercept"].ravel(),
+        "T": stats["t"].ravel(),
+    })
+
+
+def rolling_correlations(indicators, crops, window=10, lag=0, min_periods=None):
+    """
+    Correlation over a moving window of ``window`` years for every indicator x
+    crop x zone, with the indicator lagged by ``lag`` years.
+
+    Returns a long DataFrame with columns Indicator, Crop, Zone, Year (the
+    last year of the window), N and R.
+    """
+    x, y, indicator_names, crop_names, zones, years = _aligned_cubes(indicators, crops)
+    if window > len(years):
+        raise ValueError(f"Window of {window} years is longer than the {len(years)} years of data")
+    x = _lagged(x, lag)[lag]
+    # Windows become a new last axis: (variable, zone, window_end, window)
+    x_windows = sliding_window_view(x, window, axis=-1)
+    y_windows = sliding_window_view(y, window, axis=-1)
+    stats = pairwise_stats(x_windows[:, None], y_windows[None], min_periods or max(3, window // 2))
+
+    indicator, crop, zone, end = np.indices(stats["r"].shape).reshape(4, -1)
+    return pd.DataFrame({
+        "Indicator": pd.Categorical.from_codes(indicator, indicator_names),
+        "Crop": pd.Categorical.from_codes(crop, crop_names),
+        "Zone": pd.Categorical.from_codes(zone, zones),
+        "Year": years.to_numpy()[end + window - 1],
+        "N": stats["n"].ravel(),
+        "R": stats["r"].ravel(),
+    })
@@ -0,0 +1,157 @@
+"""
+Batch rendering of the indicator and crop-yield figures.
+
+Data_ANALYSIS.ipynb redraws every seaborn grid and one Plotly figure per
+indicator or crop on each run. ``render_figures`` takes a tidy table
+(Year, Zone, Variable, Value, as produced by ``savanna_loader``) and renders,
+for each dataset:
+
+* one PNG grid with a panel per variable (the notebook's subplot layout),
+* one PNG per variable,
+* one self-contained interactive HTML file holding every variable.
+
+Figures are drawn in a process pool with the Agg backend. Each figure's input
+data is hashed and recorded in a manifest, so figures whose data did not
+change are skipped on the next run:
+
+    from figure_rendering import render_figures
+    from savanna_loader import load_zone_sheets
+
+    render_figures(load_zone_sheets(paths), "figures")
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+
+MANIFEST_FILENAME = ".render_manifest.json"
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(text)).strip("_")
+
+
+def data_hash(data, *params):
+    """
+    Stable hash of a tidy frame's rows plus any rendering parameters.
+    """
+    data = data.sort_values(["Variable", "Zone", "Year"]).reset_index(drop=True)
+    digest = hashlib.sha256(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    digest.update(json.dumps(params, default=str).encode())
+    return digest.hexdigest()
+
+
+def _render_png(job):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    data = job["data"]
+    variables = list(pd.unique(data["Variable"]))
+    with plt.style.context("seaborn-v0_8-whitegrid"):
+        fig, axes = plt.subplots(len(variables), 1, figsize=(14, 2.4 * len(variables) + 0.6),
+                                 sharex=True, squeeze=False)
+        for ax, variable in zip(axes[:, 0], variables):
+            series = data[data["Variable"] == variable]
+            for zone, zone_data in series.groupby("Zone", observed=True, sort=False):
+                zone_data = zone_data.sort_values("Year")
+                ax.plot(zone_data["Year"], zone_data["Value"], label=zone)
+            ax.set_title(f"{variable} variability across zones", fontsize=14)
+            ax.legend(title="Zone")
+        axes[-1, 0].set_xlabel("Year", fontsize=12)
+        fig.tight_layout()
+        fig.savefig(job["path"], dpi=job["dpi"], bbox_inches="tight")
+        plt.close(fig)
+    return job["path"]
+
+
+def _render_html(job):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    data = job["data"]
+    variables = list(pd.unique(data["Variable"]))
+    fig = make_subplots(rows=len(variables), cols=1, shared_xaxes=True, subplot_titles=variables)
+    for row, variable in enumerate(variables, start=1):
+        series = data[data["Variable"] == variable]
+        for zone, zone_data in series.groupby("Zone", observed=True, sort=False):
+            zone_data = zone_data.sort_values("Year")
+            fig.add_trace(
+                go.Scatter(x=zone_data["Year"], y=zone_data["Value"], mode="lines",
+                           name=f"{variable} {zone}", legendgroup=str(zone)),
+                row=row, col=1,
+            )
+    fig.update_layout(title=job["title"], height=300 * len(variables))
+    fig.write_html(job["path"], include_plotlyjs=True, full_html=True)
+    return job["path"]
+
+
+def _render(job):
+    if job["kind"] == "html":
+        return _render_html(job)
+    return _render_png(job)
+
+
+def plan_figures(tidy, output_dir, dataset_column="Source", default_dataset="indicators", dpi=300):
+    """
+    List the figures to render as job dicts (kind, title, path, data, dpi, hash).
+    """
+    if dataset_column in tidy.columns:
+        datasets = tidy.groupby(dataset_column, observed=True, sort=False)
+    else:
+        datasets = [(default_dataset, tidy)]
+
+    jobs = []
+    for dataset, data in datasets:
+        data = data[["Year", "Zone", "Variable", "Value"]]
+        name = _slug(dataset)
+        jobs.append({"kind": "png", "title": str(dataset), "data": data, "dpi": dpi,
+                     "path": os.path.join(output_dir, f"{name}.png")})
+        jobs.append({"kind": "html", "title": str(dataset), "data": data, "dpi": dpi,
+                     "path": os.path.join(output_dir, f"{name}.html")})
+        for variable, variable_data in data.groupby("Variable", observed=True, sort=False):
+            jobs.append({"kind": "png", "title": f"{dataset} {variable}", "data": variable_data, "dpi": dpi,
+                         "path": os.path.join(output_dir, f"{name}_{_slug(variable)}.png")})
+    for job in jobs:
+        job["hash"] = data_hash(job["data"], job["kind"], job["dpi"])
+    return jobs
+
+
+def render_figures(tidy, output_dir, dataset_column="Source", default_dataset="indicators",
+                   dpi=300, workers=None, force=False):
+    """
+    Render every planned figure whose data changed since the last run.
+
+    Returns a dict with the ``rendered`` and ``skipped`` file paths.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+    jobs = plan_figures(tidy, output_dir, dataset_column, default_dataset, dpi)
+    pending, skipped = [], []
+    for job in jobs:
+        key = os.path.basename(job["path"])
+        if not force and manifest.get(key) == job["hash"] and os.path.exists(job["path"]):
+            skipped.append(job["path"])
+        else:
+            pending.append(job)
+
+    rendered = []
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            for job, path in zip(pending, pool.map(_render, pending)):
+                manifest[os.path.basename(path)] = job["hash"]
+                rendered.append(path)
+        with open(manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    return {"rendered": rendered, "skipped": skipped}
@@ -0,0 +1,237 @@
+"""
+Flight-path reconstruction for long telemetry tracks.
+
+The drone guide suggests a ``QgsLineString`` for the flight path but only ever
+adds single points. ``build_tracks`` turns a stream of fixes into one
+LineString per flight (split again wherever the recorder went quiet),
+simplifies each line with a vectorised Douglas-Peucker pass and summarises the
+per-segment speed, climb rate and distance computed with NumPy differences:
+
+    from dji_flight_logs import open_flight_archive
+    from flight_tracks import tracks_from_archive
+
+    tracks = tracks_from_archive(open_flight_archive("flight_archive").to_table())
+
+The result is an Arrow table with a WKB ``geometry`` column, so it can be
+written to GeoParquet or loaded into geopandas / QGIS like the raw archive.
+"""
+
+import json
+
+import numpy as np
+import pyarrow as pa
+
+from telemetry_geometry import linestring_to_wkb, telemetry_xy
+
+EARTH_RADIUS_M = 6371008.8
+
+TRACK_SCHEMA = pa.schema([
+    ("flight_id", pa.string()),
+    ("track_id", pa.int32()),
+    ("start", pa.timestamp("ms")),
+    ("end", pa.timestamp("ms")),
+    ("fixes", pa.int32()),
+    ("vertices", pa.int32()),
+    ("length_m", pa.float64()),
+    ("duration_s", pa.float64()),
+    ("max_speed", pa.float32()),
+    ("max_climb_rate", pa.float32()),
+    ("max_altitude", pa.float32()),
+    ("geometry", pa.binary()),
+])
+
+GEO_METADATA = {
+    "version": "1.0.0",
+    "primary_column": "geometry",
+    "columns": {"geometry": {"encoding": "WKB", "geometry_types": ["LineString"]}},
+}
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in metres between coordinate arrays (degrees).
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def segment_metrics(seconds, latitude, longitude, altitude=None):
+    """
+    Per-segment distance (m), duration (s), ground speed (m/s) and climb rate
+    (m/s) between consecutive fixes, plus the cumulative distance at each fix.
+
+    Segments with no elapsed time get NaN speed and climb rate.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    duration = np.diff(seconds)
+    distance = haversine(latitude[:-1], longitude[:-1], latitude[1:], longitude[1:])
+    if altitude is None:
+        climb = np.full(len(duration), np.nan)
+    else:
+        climb = np.diff(np.asarray(altitude, dtype=np.float64))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speed = np.where(duration > 0, distance / duration, np.nan)
+        climb_rate = np.where(duration > 0, climb / duration, np.nan)
+    return {
+        "distance": distance,
+        "duration": duration,
+        "speed": speed,
+        "climb_rate": climb_rate,
+        "cumulative_distance": np.concatenate(([0.0], np.cumsum(distance))),
+    }
+
+
+def split_tracks(seconds, flight_ids=None, max_gap=30.0):
+    """
+    Return (start, stop) index pairs for runs of fixes that belong to the same
+    flight and have no gap longer than ``max_gap`` seconds.
+
+    Fixes must already be sorted by flight and time.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    breaks = np.diff(seconds) > max_gap
+    if flight_ids is not None:
+        flight_ids = np.asarray(flight_ids)
+        breaks |= flight_ids[1:] != flight_ids[:-1]
+    bounds = np.concatenate(([0], np.flatnonzero(breaks) + 1, [len(seconds)]))
+    return np.column_stack((bounds[:-1], bounds[1:]))
+
+
+def _local_xy(latitude, longitude):
+    """
+    Project to metres on a plane tangent at the track's mean latitude, which is
+    accurate enough for tolerances of a few metres over a single flight.
+    """
+    lat0 = np.radians(np.mean(latitude))
+    x = np.radians(longitude) * EARTH_RADIUS_M * np.cos(lat0)
+    y = np.radians(latitude) * EARTH_RADIUS_M
+    return x, y
+
+
+def simplify(seconds, latitude, longitude, tolerance=5.0, time_aware=True):
+    """
+    Douglas-Peucker simplification, returning a boolean mask of kept fixes.
+
+    Every split level is evaluated for all points at once instead of recursing
+    per range. With ``time_aware`` the error of a fix is its distance from the
+    position interpolated *in time* along the chord (synchronised Euclidean
+    distance), which preserves hovering and speed changes as well as shape;
+    otherwise the classic perpendicular distance is used. ``tolerance`` is in
+    metres.
+    """
+    count = len(latitude)
+    keep = np.zeros(count, dtype=bool)
+    if count <= 2:
+        keep[:] = True
+        return keep
+    keep[[0, -1]] = True
+
+    x, y = _local_xy(latitude, longitude)
+    t = np.asarray(seconds, dtype=np.float64)
+    index = np.arange(count)
+
+    while True:
+        anchors = np.flatnonzero(keep)
+        span = np.minimum(np.searchsorted(anchors, index, side="right") - 1, len(anchors) - 2)
+        a, b = anchors[span], anchors[span + 1]
+        dx, dy = x[b] - x[a], y[b] - y[a]
+
+        if time_aware:
+            dt = t[b] - t[a]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(dt > 0, (t - t[a]) / dt, 0.0)
+        else:
+            length2 = dx * dx + dy * dy
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(length2 > 0, ((x - x[a]) * dx + (y - y[a]) * dy) / length2, 0.0)
+            ratio = np.clip(ratio, 0.0, 1.0)
+        error = np.hypot(x - (x[a] + ratio * dx), y - (y[a] + ratio * dy))
+        error[keep] = 0.0
+
+        worst = np.maximum.reduceat(error, anchors[:-1])
+        split = worst > tolerance
+        if not split.any():
+            return keep
+        # Keep the first fix reaching the maximum in every span that is split
+        candidates = np.flatnonzero(split[span] & (error == worst[span]))
+        _, first = np.unique(span[candidates], return_index=True)
+        keep[candidates[first]] = True
+
+
+def build_tracks(seconds, latitude, longitude, altitude=None, flight_ids=None,
+                 max_gap=30.0, tolerance=5.0, time_aware=True):
+    """
+    Build one simplified LineString per flight / gap-separated run.
+
+    Inputs are parallel arrays sorted by flight and time; ``seconds`` is epoch
+    seconds. Runs with fewer than two fixes are skipped. Returns an Arrow
+    table with ``TRACK_SCHEMA`` whose statistics come from the full-resolution
+    fixes, not the simplified line. ``tolerance=None`` skips simplification
+    and keeps every fix.
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    latitude = np.asarray(latitude, dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    if altitude is not None:
+        altitude = np.asarray(altitude, dtype=np.float64)
+    if flight_ids is not None:
+        flight_ids = np.asarray(flight_ids)
+
+    # Metrics for the whole stream at once; segments that cross a track
+    # boundary are masked out per track below.
+    metrics = segment_metrics(seconds, latitude, longitude, altitude)
+
+    rows = {name: [] for name in TRACK_SCHEMA.names}
+    track_counter = {}
+    for start, stop in split_tracks(seconds, flight_ids, max_gap):
+        if stop - start < 2:
+            continue
+        flight_id = str(flight_ids[start]) if flight_ids is not None else ""
+        track_id = track_counter.get(flight_id, 0)
+        track_counter[flight_id] = track_id + 1
+
+        run = slice(start, stop)
+        segments = slice(start, stop - 1)
+        if tolerance is None:
+            keep = np.ones(stop - start, dtype=bool)
+        else:
+            keep = simplify(seconds[run], latitude[run], longitude[run], tolerance, time_aware)
+
+        rows["flight_id"].append(flight_id)
+        rows["track_id"].append(track_id)
+        rows["start"].append(int(seconds[start] * 1000))
+        rows["end"].append(int(seconds[stop - 1] * 1000))
+        rows["fixes"].append(stop - start)
+        rows["vertices"].append(int(keep.sum()))
+        rows["length_m"].append(float(metrics["distance"][segments].sum()))
+        rows["duration_s"].append(float(seconds[stop - 1] - seconds[start]))
+        rows["max_speed"].append(_nanmax(metrics["speed"][segments]))
+        rows["max_climb_rate"].append(_nanmax(metrics["climb_rate"][segments]))
+        rows["max_altitude"].append(_nanmax(altitude[run]) if altitude is not None else None)
+        x, y = telemetry_xy(latitude[run][keep], longitude[run][keep])
+        rows["geometry"].append(linestring_to_wkb(x, y))
+
+    return pa.table(rows, schema=TRACK_SCHEMA.with_metadata({"geo": json.dumps(GEO_METADATA)}))
+
+
+def _nanmax(values):
+    values = values[~np.isnan(values)]
+    return float(values.max()) if len(values) else None
+
+
+def tracks_from_archive(table, **options):
+    """
+    Build tracks from a telemetry table read from the flight archive written
+    by ``dji_flight_logs.write_flight_archive``.
+    """
+    table = table.sort_by([("flight_id", "ascending"), ("time", "ascending")])
+    seconds = table["time"].to_numpy().astype("datetime64[ms]").astype(np.int64) / 1000.0
+    return build_tracks(
+        seconds,
+        table["latitude"].to_numpy(),
+        table["longitude"].to_numpy(),
+        altitude=table["altitude"].to_numpy(),
+        flight_ids=table["flight_id"].to_numpy(),
+        **options,
+    )
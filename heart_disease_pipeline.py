@@ -0,0 +1,151 @@
+"""
+Reproducible heart-disease classifier.
+
+Machine_Learning.ipynb loads "Heart disease data.csv" twice, replaces '?'
+and converts the numeric columns one at a time before fitting a single
+DecisionTreeClassifier on one split. Here:
+
+* the cleaned feature matrix is memoised on disk with ``joblib.Memory`` and
+  is rebuilt only when the CSV changes,
+* imputation and the model live in one scikit-learn ``Pipeline``, so the
+  training means travel with the model and new batches need no manual
+  cleaning,
+* model selection is a stratified k-fold ``GridSearchCV`` across all cores,
+* the fitted pipeline is saved with joblib for fast batch scoring.
+
+    from heart_disease_pipeline import load_heart_data, select_model, save_model, score_batch
+
+    X, y = load_heart_data("Heart disease data.csv")
+    search = select_model(X, y)
+    save_model(search.best_estimator_, "heart_model.joblib")
+    score_batch("heart_model.joblib", "new_patients.csv", "scored.csv")
+"""
+
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.impute import SimpleImputer
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+CACHE_DIR = ".heart_cache"
+LABEL_COLUMN = "num"
+FEATURE_COLUMNS = [
+    "age", "sex", "cp", "trestbps", "chol", "fbs", "restecg",
+    "thalach", "exang", "oldpeak", "slope", "ca", "thal",
+]
+PARAM_GRID = {
+    "model__max_depth": [3, 4, 5, 6, 8, None],
+    "model__min_samples_leaf": [1, 2, 5, 10],
+    "model__criterion": ["gini", "entropy"],
+}
+
+memory = joblib.Memory(CACHE_DIR, verbose=0)
+
+
+def read_patients(path, **options):
+    """
+    Read a patient CSV; '?' becomes NaN while parsing instead of in a
+    separate replace pass.
+    """
+    df = pd.read_csv(path, na_values="?", skipinitialspace=True, **options)
+    if isinstance(df, pd.DataFrame):
+        df.columns = df.columns.str.strip()
+    return df
+
+
+def patient_features(df):
+    """
+    The ``FEATURE_COLUMNS`` of ``df`` as float32. Stray text left in any
+    column is coerced to NaN in one pass over all cells.
+    """
+    features = df.reindex(columns=FEATURE_COLUMNS)
+    if (features.dtypes == object).any():
+        values = pd.to_numeric(features.to_numpy().ravel(), errors="coerce").reshape(features.shape)
+        features = pd.DataFrame(values, columns=FEATURE_COLUMNS, index=features.index)
+    return features.astype(np.float32)
+
+
+@memory.cache
+def _clean(path, modified):
+    df = read_patients(path)
+    X = patient_features(df)
+    labelled = df[LABEL_COLUMN].notna().to_numpy()
+    y = (pd.to_numeric(df[LABEL_COLUMN], errors="coerce") > 0).astype(np.int8)
+    return X[labelled].reset_index(drop=True), y[labelled].reset_index(drop=True)
+
+
+def load_heart_data(path="Heart disease data.csv"):
+    """
+    Return the feature matrix and binary label (1 = disease, ``num > 0``).
+
+    The result is cached on disk; the file's modification time is part of the
+    cache key, so editing the CSV invalidates it.
+    """
+    return _clean(os.path.abspath(path), os.path.getmtime(path))
+
+
+def build_pipeline(random_state=42):
+    """
+    Mean imputation followed by a decision tree, as in the notebook.
+    """
+    return Pipeline([
+        ("impute", SimpleImputer(strategy="mean")),
+        ("model", DecisionTreeClassifier(random_state=random_state)),
+    ])
+
+
+def select_model(X, y, param_grid=None, folds=5, n_jobs=-1, scoring="accuracy", random_state=42):
+    """
+    Grid-search the pipeline with stratified k-fold cross-validation on all
+    cores. Returns the fitted ``GridSearchCV``; ``best_estimator_`` is refit
+    on all of ``X``.
+    """
+    search = GridSearchCV(
+        build_pipeline(random_state),
+        param_grid or PARAM_GRID,
+        cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state),
+        scoring=scoring,
+        n_jobs=n_jobs,
+    )
+    return search.fit(X, y)
+
+
+def save_model(model, path):
+    joblib.dump(model, path)
+
+
+def load_model(path):
+    return joblib.load(path)
+
+
+def score_batch(model_path, csv_path, output_path=None, chunksize=None):
+    """
+    Score a CSV of new patients with a saved pipeline, adding ``prediction``
+    and ``probability`` (of disease) columns. With ``chunksize`` the file is
+    scored in pieces and ``output_path`` is required.
+    """
+    model = load_model(model_path)
+
+    def score(df):
+        df.columns = df.columns.str.strip()
+        X = patient_features(df)
+        df["prediction"] = model.predict(X)
+        df["probability"] = model.predict_proba(X)[:, 1]
+        return df
+
+    if chunksize is None:
+        scored = score(read_patients(csv_path))
+        if output_path:
+            scored.to_csv(output_path, index=False)
+        return scored
+
+    if not output_path:
+        raise ValueError("output_path is required when scoring in chunks")
+    chunks = read_patients(csv_path, chunksize=chunksize)
+    for number, chunk in enumerate(chunks):
+        score(chunk).to_csv(output_path, mode="w" if number == 0 else "a", header=number == 0, index=False)
+    return output_path
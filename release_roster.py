@@ -0,0 +1,129 @@
+"""
+Batch release-date calculation for whole inmate rosters (2/3 rule).
+
+``InmateReleaseCalculator`` in "Correctional Service.py" handles one inmate
+from keyboard input, counts a year as 365 days and a month as 30, and reads
+``datetime.today()`` on every call. This module applies the same 2/3 rule to
+every row of a roster at once with NumPy ``datetime64`` arithmetic:
+
+* one reference date for the whole run (default: today),
+* calendar-aware years and months (2 months from 31 December is 28/29
+  February, leap years count 366 days),
+* the sentence start is the reference date minus the time served, unless
+  the roster has a ``sentence_start`` date for that row.
+
+    from release_roster import read_roster, compute_release_dates
+
+    roster = compute_release_dates(read_roster("roster.csv"), reference_date="2026-01-01")
+
+or from the command line:
+
+    python release_roster.py roster.csv --reference-date 2026-01-01 -o releases.csv
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+SENTENCE_COLUMNS = ["sentence_years", "sentence_months", "sentence_days"]
+SERVED_COLUMNS = ["served_years", "served_months", "served_days"]
+RELEASE_FRACTION = 2 / 3
+
+
+def read_roster(path):
+    """
+    Read a roster CSV or Parquet file with the sentence and served columns
+    as int32 (missing parts count as 0).
+    """
+    if os.path.splitext(path)[1].lower() in (".parquet", ".pq"):
+        roster = pd.read_parquet(path)
+    else:
+        roster = pd.read_csv(path)
+    columns = [column for column in SENTENCE_COLUMNS + SERVED_COLUMNS if column in roster.columns]
+    roster[columns] = roster[columns].fillna(0).astype(np.int32)
+    if "sentence_start" in roster.columns:
+        roster["sentence_start"] = pd.to_datetime(roster["sentence_start"])
+    return roster
+
+
+def add_calendar(dates, years, months, days, sign=1):
+    """
+    Add (``sign=1``) or subtract (``sign=-1``) calendar years, months and
+    days to an array of ``datetime64[D]`` dates.
+
+    Months are applied first and the day of month is clipped to the length
+    of the target month, then the days are added.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    month_start = dates.astype("datetime64[M]")
+    day_of_month = (dates - month_start.astype("datetime64[D]")).astype(np.int64)
+
+    target = month_start + sign * (np.asarray(years, np.int64) * 12 + np.asarray(months, np.int64))
+    month_length = ((target + 1).astype("datetime64[D]") - target.astype("datetime64[D]")).astype(np.int64)
+    shifted = target.astype("datetime64[D]") + np.minimum(day_of_month, month_length - 1)
+    return shifted + sign * np.asarray(days, np.int64)
+
+
+def _parts(roster, columns):
+    return [roster[column].to_numpy(np.int64) if column in roster.columns else 0 for column in columns]
+
+
+def compute_release_dates(roster, reference_date=None, fraction=RELEASE_FRACTION):
+    """
+    Add the 2/3-rule dates to a copy of ``roster``:
+
+    sentence_start, sentence_end, sentence_length (days), served_length
+    (days), two_thirds_date, time_left (days, never negative) and
+    release_date (the 2/3 date, or the reference date when it has passed).
+
+    The 2/3 point is rounded up to a whole day, so at least two thirds of
+    the sentence is always served. The reference date is kept in
+    ``result.attrs["reference_date"]``.
+    """
+    reference = np.datetime64(reference_date or pd.Timestamp.today().date(), "D")
+    result = roster.copy()
+    count = len(result)
+
+    start = add_calendar(np.full(count, reference), *_parts(result, SERVED_COLUMNS), sign=-1)
+    if "sentence_start" in result.columns:
+        given = result["sentence_start"].to_numpy("datetime64[D]")
+        start = np.where(np.isnat(given), start, given)
+    end = add_calendar(start, *_parts(result, SENTENCE_COLUMNS))
+
+    sentence_length = (end - start).astype(np.int64)
+    served_length = (reference - start).astype(np.int64)
+    # The small epsilon stops float error turning an exact 2/3 into an extra day
+    two_thirds = start + np.ceil(sentence_length * fraction - 1e-9).astype(np.int64)
+    time_left = np.maximum((two_thirds - reference).astype(np.int64), 0)
+
+    result["sentence_start"] = start
+    result["sentence_end"] = end
+    result["sentence_length"] = sentence_length.astype(np.int32)
+    result["served_length"] = served_length.astype(np.int32)
+    result["two_thirds_date"] = two_thirds
+    result["time_left"] = time_left.astype(np.int32)
+    result["release_date"] = np.maximum(two_thirds, reference)
+    result.attrs["reference_date"] = str(reference)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute 2/3-rule release dates for a roster.")
+    parser.add_argument("roster", help="roster CSV or Parquet file")
+    parser.add_argument("--reference-date", help="date the served time is counted to (default: today)")
+    parser.add_argument("-o", "--output", help="write the result to this CSV or Parquet file")
+    args = parser.parse_args()
+
+    result = compute_release_dates(read_roster(args.roster), args.reference_date)
+    if args.output and os.path.splitext(args.output)[1].lower() in (".parquet", ".pq"):
+        result.to_parquet(args.output, index=False)
+    elif args.output:
+        result.to_csv(args.output, index=False)
+    else:
+        print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
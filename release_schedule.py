@@ -0,0 +1,179 @@
+"""
+Release-schedule index and capacity forecasting for a correctional roster.
+
+Built once from the output of ``release_roster.compute_release_dates``, a
+``ReleaseIndex`` keeps the release dates sorted so planners' questions are
+answered with ``searchsorted`` instead of rerunning the roster:
+
+    from release_roster import read_roster, compute_release_dates
+    from release_schedule import ReleaseIndex
+
+    releases = compute_release_dates(read_roster("roster.csv"), "2026-01-01")
+    index = ReleaseIndex(releases)                     # reference date 2026-01-01
+    index.between("2026-03-01", "2026-03-31", facility="Pademba Road")
+    weekly = index.weekly_releases(weeks=104)          # (facility, week) counts
+    occupancy = index.occupancy_forecast(weeks=104)    # (facility, week) head count
+
+The index takes its reference date (the start of the forecasts, and the date
+``update_inmate`` counts served time to) from the roster result; pass
+``reference_date`` when the releases were read back from a file. When one
+inmate's sentence or remission changes, ``update_inmate`` recomputes that row
+alone and moves it within the sorted arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+from release_roster import compute_release_dates
+
+ALL_FACILITIES = "all"
+
+
+def _day(value):
+    return np.datetime64(value, "D").astype(np.int64)
+
+
+class ReleaseIndex:
+    """
+    Release dates sorted ascending, with the matching inmate ids and facility
+    codes. ``id_column`` and ``facility_column`` name the roster columns; the
+    row index stands in for a missing id, and every inmate shares one
+    facility when there is no facility column.
+
+    ``reference_date`` defaults to the one ``compute_release_dates`` stored in
+    ``releases.attrs``; it is required when that is missing.
+    """
+
+    def __init__(self, releases, id_column="inmate_id", facility_column="facility", reference_date=None):
+        self.id_column = id_column
+        self.facility_column = facility_column
+        if reference_date is None:
+            reference_date = releases.attrs.get("reference_date")
+        if reference_date is None:
+            raise ValueError("reference_date is required when releases do not come from compute_release_dates")
+        self.reference = _day(reference_date)
+
+        ids = releases[id_column].to_numpy() if id_column in releases.columns else releases.index.to_numpy()
+        if facility_column in releases.columns:
+            facilities = pd.Categorical(releases[facility_column].astype(str))
+        else:
+            facilities = pd.Categorical(np.full(len(releases), ALL_FACILITIES))
+        self.facilities = list(facilities.categories)
+
+        days = releases["release_date"].to_numpy("datetime64[D]").astype(np.int64)
+        order = np.argsort(days, kind="stable")
+        self.days = days[order]
+        self.ids = ids[order]
+        self.codes = facilities.codes[order].astype(np.int32)
+        self._release_day = dict(zip(self.ids.tolist(), self.days.tolist()))
+
+    def __len__(self):
+        return len(self.days)
+
+    def _facility_code(self, facility):
+        if facility not in self.facilities:
+            self.facilities.append(facility)
+        return self.facilities.index(facility)
+
+    def between(self, start, end, facility=None):
+        """
+        Inmates releasing from ``start`` to ``end`` inclusive, in date order.
+        """
+        lo = np.searchsorted(self.days, _day(start), side="left")
+        hi = np.searchsorted(self.days, _day(end), side="right")
+        days, ids, codes = self.days[lo:hi], self.ids[lo:hi], self.codes[lo:hi]
+        if facility is not None:
+            if facility not in self.facilities:
+                raise ValueError(f"Unknown facility {facility!r}; the index has {self.facilities}")
+            keep = codes == self.facilities.index(facility)
+            days, ids, codes = days[keep], ids[keep], codes[keep]
+        return pd.DataFrame({
+            self.id_column: ids,
+            self.facility_column: np.asarray(self.facilities, dtype=object)[codes],
+            "release_date": days.astype("datetime64[D]"),
+        })
+
+    def _week_edges(self, start, weeks):
+        start = self.reference if start is None else _day(start)
+        return start + 7 * np.arange(weeks + 1)
+
+    def weekly_releases(self, start=None, weeks=104):
+        """
+        Releases per facility and week as an int array of shape
+        (facility, week). Week ``w`` covers ``start + 7w`` up to but not
+        including ``start + 7(w + 1)``; ``start`` defaults to the reference
+        date.
+        """
+        edges = self._week_edges(start, weeks)
+        lo, hi = np.searchsorted(self.days, edges[[0, -1]], side="left")
+        week = (self.days[lo:hi] - edges[0]) // 7
+        flat = np.bincount(self.codes[lo:hi] * weeks + week, minlength=len(self.facilities) * weeks)
+        return flat.reshape(len(self.facilities), weeks)
+
+    def occupancy_forecast(self, start=None, weeks=104, admissions_per_week=0):
+        """
+        Expected head count per facility at the end of each week, shape
+        (facility, week): inmates still held at ``start`` minus cumulative
+        releases, plus ``admissions_per_week`` (a scalar or one value per
+        facility) for every week elapsed.
+        """
+        edges = self._week_edges(start, weeks)
+        held = np.searchsorted(self.days, edges[0], side="left")
+        population = np.bincount(self.codes[held:], minlength=len(self.facilities))
+        released = np.cumsum(self.weekly_releases(start, weeks), axis=1)
+        admitted = np.outer(np.broadcast_to(admissions_per_week, (len(self.facilities),)), np.arange(1, weeks + 1))
+        return population[:, None] - released + admitted
+
+    def _position(self, inmate_id):
+        day = self._release_day[inmate_id]
+        lo = np.searchsorted(self.days, day, side="left")
+        hi = np.searchsorted(self.days, day, side="right")
+        return lo + np.flatnonzero(self.ids[lo:hi] == inmate_id)[0]
+
+    def facility_of(self, inmate_id):
+        """
+        The facility an indexed inmate is held at.
+        """
+        return self.facilities[self.codes[self._position(inmate_id)]]
+
+    def remove(self, inmate_id):
+        """
+        Drop one inmate from the index (for example on transfer).
+        """
+        position = self._position(inmate_id)
+        del self._release_day[inmate_id]
+        self.days = np.delete(self.days, position)
+        self.ids = np.delete(self.ids, position)
+        self.codes = np.delete(self.codes, position)
+
+    def insert(self, inmate_id, release_date, facility=ALL_FACILITIES):
+        """
+        Add or move one inmate, keeping the arrays sorted.
+        """
+        if inmate_id in self._release_day:
+            self.remove(inmate_id)
+        day = _day(release_date)
+        position = np.searchsorted(self.days, day, side="right")
+        self.days = np.insert(self.days, position, day)
+        self.ids = np.insert(self.ids, position, inmate_id)
+        self.codes = np.insert(self.codes, position, self._facility_code(facility))
+        self._release_day[inmate_id] = day
+
+    def update_inmate(self, record):
+        """
+        Recompute one inmate's release date after a sentence or remission
+        change and move it in the index. ``record`` is a mapping with the
+        roster columns for that inmate; the index's reference date is used.
+        Without a facility in ``record`` the inmate stays where they are
+        (``ALL_FACILITIES`` for an inmate new to the index).
+        """
+        row = compute_release_dates(pd.DataFrame([dict(record)]), self.reference.astype("datetime64[D]"))
+        inmate_id = record[self.id_column]
+        if self.facility_column in record:
+            facility = str(record[self.facility_column])
+        elif inmate_id in self._release_day:
+            facility = self.facility_of(inmate_id)
+        else:
+            facility = ALL_FACILITIES
+        self.insert(inmate_id, row["release_date"].iloc[0], facility)
+        return row
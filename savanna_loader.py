@@ -0,0 +1,119 @@
+"""
+Loader for the Savanna zone indicator and crop-yield sheets.
+
+The sheets used in Data_ANALYSIS.ipynb have a two-row header: the first row
+names the indicator or crop and the second row names the zone. The crop sheet
+writes each crop once, above its first zone column, with ``Year`` in the
+second row; the indicator sheet repeats each indicator and puts ``Years`` in
+the first row:
+
+    ,Rice,,,Maize,,                         Years,SPEI,SPEI,SPEI,NDVI,...
+    Year,Guinea,Sudan,Sahel,Guinea,...      ,Guinea,Sudan,Sahel,Guinea,...
+    1990,1.2,1.1,0.9,...                    1994,-0.628,-0.829,-0.54,...
+
+``read_zone_sheet`` reads that header directly, forward-fills the top level
+and converts every value in one vectorised step to float32, returning a tidy
+table with the columns Year, Zone, Variable and Value:
+
+    from savanna_loader import load_zone_sheets, to_wide
+
+    crops = load_zone_sheets(["For data analysis (2).csv"])
+    df_crops = to_wide(crops)           # Rice_Guinea, Rice_Sudan, ... as in the notebook
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+TIDY_COLUMNS = ["Year", "Zone", "Variable", "Value"]
+YEAR_NAMES = ("year", "years")
+
+
+def _read_two_row_header(path, sheet_name=0):
+    if os.path.splitext(path)[1].lower() in (".xls", ".xlsx"):
+        return pd.read_excel(path, sheet_name=sheet_name, header=[0, 1])
+    return pd.read_csv(path, header=[0, 1])
+
+
+def _header_level(df, level):
+    """
+    One header row as strings, with pandas' ``Unnamed: ...`` placeholders for
+    empty cells turned into NaN.
+    """
+    names = pd.Series(df.columns.get_level_values(level), dtype="object").astype(str).str.strip()
+    return names.mask(names.str.startswith("Unnamed:") | (names == ""))
+
+
+def read_zone_sheet(path, sheet_name=0, dropna=True):
+    """
+    Read one two-row-header sheet into a tidy (Year, Zone, Variable, Value)
+    table. Zone and Variable are categoricals, Value is float32.
+
+    Cells that are not numbers become NaN; with ``dropna`` those rows are
+    removed, as the notebook does.
+    """
+    df = _read_two_row_header(path, sheet_name)
+
+    top = _header_level(df, 0)
+    zones = _header_level(df, 1)
+
+    is_year = top.str.lower().isin(YEAR_NAMES) | zones.str.lower().isin(YEAR_NAMES)
+    year_position = np.flatnonzero(is_year.to_numpy())
+    if not len(year_position):
+        raise ValueError(f"No 'Year' or 'Years' column in either header row of {path}")
+    year_position = year_position[0]
+    top = top.ffill()
+    value_positions = np.flatnonzero(np.arange(len(zones)) != year_position)
+
+    years = pd.to_numeric(df.iloc[:, year_position], errors="coerce")
+    valid_years = years.notna().to_numpy()
+    years = years[valid_years].astype(np.int16).to_numpy()
+
+    # One conversion pass over every value cell instead of one per column
+    raw = df.iloc[valid_years, value_positions].to_numpy()
+    if raw.dtype == object:
+        raw = pd.to_numeric(raw.ravel(), errors="coerce").reshape(raw.shape)
+    values = raw.astype(np.float32)
+
+    rows, columns = values.shape
+    tidy = pd.DataFrame({
+        "Year": np.repeat(years, columns),
+        "Zone": pd.Categorical(np.tile(zones.to_numpy()[value_positions], rows)),
+        "Variable": pd.Categorical(np.tile(top.to_numpy()[value_positions], rows)),
+        "Value": values.ravel(),
+    })
+    if dropna:
+        tidy = tidy[tidy["Value"].notna()].reset_index(drop=True)
+    return tidy
+
+
+def load_zone_sheets(paths, sheet_name=0, dropna=True):
+    """
+    Load many zone or station sheets into one tidy table. A categorical
+    ``Source`` column holds each file's name without extension.
+    """
+    frames = []
+    for path in paths:
+        frame = read_zone_sheet(path, sheet_name=sheet_name, dropna=dropna)
+        frame["Source"] = os.path.splitext(os.path.basename(path))[0]
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=TIDY_COLUMNS + ["Source"])
+    # concat falls back to object when the sheets have different categories
+    tidy = pd.concat(frames, ignore_index=True)
+    for column in ("Zone", "Variable", "Source"):
+        tidy[column] = tidy[column].astype("category")
+    return tidy
+
+
+def to_wide(tidy, aggfunc="mean"):
+    """
+    Pivot a tidy table back to the notebook layout: one row per Year and one
+    ``{Variable}_{Zone}`` column per series (e.g. ``SPEI_Guinea``).
+    """
+    wide = tidy.pivot_table(
+        index="Year", columns=["Variable", "Zone"], values="Value", aggfunc=aggfunc, observed=True,
+    )
+    wide.columns = [f"{variable}_{zone}" for variable, zone in wide.columns]
+    return wide.reset_index()
@@ -0,0 +1,134 @@
+"""
+Coordinate handling for drone telemetry.
+
+Telemetry arrives as latitude/longitude, but every geometry API (QGIS, WKB,
+GeoParquet, pyproj with ``always_xy``) wants x = longitude first. The drone
+guide's ``QgsPoint(telemetry.latitude, telemetry.longitude)`` gets this
+backwards. All conversions from telemetry arrays to geometry go through this
+module so the axis order is decided in one place, and whole arrays are encoded
+or reprojected per call instead of building one ``QgsPoint`` per fix:
+
+    x, y = telemetry_xy(latitude, longitude)
+    wkb = points_to_wkb(x, y, altitude)
+    easting, northing, epsg = to_utm(latitude, longitude)
+"""
+
+import numpy as np
+
+WKB_POINT = 1
+WKB_LINESTRING = 2
+# ISO WKB adds 1000 to the type code for geometries with a Z coordinate
+WKB_Z_OFFSET = 1000
+
+
+def valid_latitude(latitude):
+    """
+    Boolean mask of latitudes within [-90, 90]. Streaming callers use it to
+    drop corrupt fixes before ``telemetry_xy`` instead of losing a batch.
+    """
+    return np.abs(np.asarray(latitude, dtype=np.float64)) <= 90
+
+
+def telemetry_xy(latitude, longitude):
+    """
+    Return (x, y) = (longitude, latitude) as float64 arrays.
+
+    Raises ``ValueError`` when any latitude is out of range, which is the
+    usual symptom of latitude and longitude having been swapped upstream.
+    Filter single bad fixes with ``valid_latitude`` first.
+    """
+    latitude = np.asarray(latitude, dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    if np.any(np.abs(latitude) > 90):
+        raise ValueError("Latitude outside [-90, 90]; are latitude and longitude swapped?")
+    return longitude, latitude
+
+
+def points_to_wkb(x, y, z=None):
+    """
+    Encode coordinate arrays as little-endian WKB points in one NumPy pass.
+
+    Returns a list of ``bytes``, one per point. Use ``points_to_wkb_array``
+    for an Arrow binary column without per-point objects.
+    """
+    data, size = _point_records(x, y, z)
+    return [data[offset:offset + size] for offset in range(0, len(data), size)]
+
+
+def points_to_wkb_array(x, y, z=None):
+    """
+    Encode coordinate arrays as an Arrow binary array of WKB points that
+    shares one contiguous buffer.
+    """
+    import pyarrow as pa
+
+    data, size = _point_records(x, y, z)
+    count = len(data) // size
+    offsets = np.arange(0, size * (count + 1), size, dtype=np.int32)
+    return pa.Array.from_buffers(pa.binary(), count, [None, pa.py_buffer(offsets), pa.py_buffer(data)])
+
+
+def _point_records(x, y, z):
+    fields = [("order", "u1"), ("type", "<u4"), ("x", "<f8"), ("y", "<f8")]
+    geometry_type = WKB_POINT
+    if z is not None:
+        fields.append(("z", "<f8"))
+        geometry_type += WKB_Z_OFFSET
+    records = np.empty(len(x), dtype=fields)
+    records["order"] = 1
+    records["type"] = geometry_type
+    records["x"] = x
+    records["y"] = y
+    if z is not None:
+        records["z"] = z
+    return records.tobytes(), records.dtype.itemsize
+
+
+def linestring_to_wkb(x, y, z=None):
+    """
+    Encode one line from coordinate arrays as little-endian WKB.
+    """
+    geometry_type = WKB_LINESTRING if z is None else WKB_LINESTRING + WKB_Z_OFFSET
+    header = np.array([(1, geometry_type, len(x))], dtype=[("order", "u1"), ("type", "<u4"), ("count", "<u4")])
+    coordinates = (x, y) if z is None else (x, y, z)
+    return header.tobytes() + np.column_stack(coordinates).astype("<f8").tobytes()
+
+
+def utm_epsg(latitude, longitude):
+    """
+    EPSG code of the WGS 84 UTM zone containing the centre of the fixes.
+    """
+    longitude = float(np.mean(longitude))
+    zone = int((longitude + 180) // 6) % 60 + 1
+    return (32600 if float(np.mean(latitude)) >= 0 else 32700) + zone
+
+
+def to_utm(latitude, longitude, epsg=None):
+    """
+    Reproject WGS 84 fixes to UTM in a single vectorised pyproj call.
+
+    The zone is chosen from the data unless ``epsg`` is given. Returns
+    (easting, northing, epsg).
+    """
+    from pyproj import Transformer
+
+    x, y = telemetry_xy(latitude, longitude)
+    if epsg is None:
+        epsg = utm_epsg(y, x)
+    transformer = Transformer.from_crs("EPSG:4326", f"EPSG:{epsg}", always_xy=True)
+    easting, northing = transformer.transform(x, y)
+    return np.asarray(easting), np.asarray(northing), epsg
+
+
+def qgs_geometries(wkb_values):
+    """
+    Turn WKB values into ``QgsGeometry`` objects for ``QgsFeature.setGeometry``.
+    """
+    from qgis.core import QgsGeometry
+
+    geometries = []
+    for wkb in wkb_values:
+        geometry = QgsGeometry()
+        geometry.fromWkb(bytes(wkb))
+        geometries.append(geometry)
+    return geometries
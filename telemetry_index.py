@@ -0,0 +1,203 @@
+"""
+Spatio-temporal index over the flight archive.
+
+Answers "which flights passed through this area, and when" without scanning
+every fix. The index maps grid cells to the flights (and flight dates) that
+visited them, with the first and last time in each cell. A query looks up the
+cells under a bounding box with ``searchsorted``, keeps entries overlapping
+the time window, and then reads only the matching ``date=`` partitions of the
+archive written by ``dji_flight_logs``:
+
+    index = TelemetryIndex.build("flight_archive")
+    index.save("flight_archive")            # stored as _telemetry_index.parquet
+    index = TelemetryIndex.load("flight_archive")
+    passes = index.query((-13.30, 8.40, -13.20, 8.50), "2024-05-01", "2024-06-01")
+
+``passes`` holds one LineString per continuous pass through the box, built
+with ``flight_tracks.build_tracks``.
+"""
+
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from dji_flight_logs import open_flight_archive
+from flight_tracks import build_tracks
+
+INDEX_FILENAME = "_telemetry_index.parquet"
+INDEX_COLUMNS = ["flight_id", "time", "latitude", "longitude", "date"]
+
+
+def _to_ms(value):
+    return np.datetime64(value, "ms").astype(np.int64)
+
+
+class TelemetryIndex:
+    """
+    Grid-cell index of archived telemetry.
+
+    Cells are ``cell_size`` degrees on a side and numbered row by row, so the
+    cells of one grid row under a bounding box form a contiguous key range.
+    """
+
+    def __init__(self, archive_path, entries, cell_size):
+        self.archive_path = archive_path
+        self.cell_size = cell_size
+        self.columns = int(round(360 / cell_size))
+        entries = entries.sort_by("cell")
+        self.cells = entries["cell"].to_numpy()
+        self.start = entries["start"].to_numpy()
+        self.end = entries["end"].to_numpy()
+        self.dates = entries["date"].to_numpy()
+        self.flights = entries["flight_id"].to_numpy()
+
+    def cell_keys(self, latitude, longitude):
+        row = np.floor((np.asarray(latitude) + 90) / self.cell_size).astype(np.int64)
+        column = np.floor((np.asarray(longitude) + 180) / self.cell_size).astype(np.int64)
+        return row * self.columns + np.minimum(column, self.columns - 1)
+
+    @classmethod
+    def build(cls, archive_path, cell_size=0.01):
+        """
+        Scan the archive once, batch by batch, and aggregate every fix into
+        (cell, date, flight) entries with their first and last time. Rebuild
+        after appending flights to the archive.
+        """
+        index = cls(archive_path, _empty_entries(), cell_size)
+        parts = []
+        for batch in open_flight_archive(archive_path).to_batches(columns=INDEX_COLUMNS):
+            if not batch.num_rows:
+                continue
+            cells = index.cell_keys(batch["latitude"].to_numpy(), batch["longitude"].to_numpy())
+            table = pa.table({
+                "cell": cells,
+                "date": batch["date"].cast(pa.string()),
+                "flight_id": batch["flight_id"],
+                "time": pc.cast(batch["time"], pa.int64()),
+            })
+            parts.append(_aggregate(table, "time", "time"))
+        if parts:
+            index = cls(archive_path, _aggregate(pa.concat_tables(parts), "start", "end"), cell_size)
+        return index
+
+    def save(self, path=None):
+        """
+        Write the index next to the archive. The leading underscore keeps the
+        file out of the archive dataset itself.
+        """
+        entries = pa.table({
+            "cell": self.cells, "date": self.dates, "flight_id": self.flights,
+            "start": self.start, "end": self.end,
+        })
+        metadata = {"cell_size": str(self.cell_size)}
+        pq.write_table(entries.replace_schema_metadata(metadata), os.path.join(path or self.archive_path, INDEX_FILENAME))
+
+    @classmethod
+    def load(cls, archive_path, path=None):
+        entries = pq.read_table(os.path.join(path or archive_path, INDEX_FILENAME))
+        cell_size = float(entries.schema.metadata[b"cell_size"])
+        return cls(archive_path, entries, cell_size)
+
+    def candidates(self, bbox, start=None, end=None):
+        """
+        Return the index positions of entries whose cell intersects ``bbox``
+        (min_lon, min_lat, max_lon, max_lat) and whose time range overlaps
+        [start, end].
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        low = self.cell_keys([min_lat, min_lat], [min_lon, max_lon])
+        high = self.cell_keys([max_lat], [max_lon])[0]
+        first_row, last_row = low[0] // self.columns, high // self.columns
+        offsets = np.arange(last_row - first_row + 1) * self.columns
+        lower = np.searchsorted(self.cells, low[0] + offsets, side="left")
+        upper = np.searchsorted(self.cells, low[1] + offsets, side="right")
+        hits = np.concatenate([np.arange(a, b) for a, b in zip(lower, upper)] or [np.empty(0, np.int64)])
+
+        if start is not None:
+            hits = hits[self.end[hits] >= _to_ms(start)]
+        if end is not None:
+            hits = hits[self.start[hits] <= _to_ms(end)]
+        return hits
+
+    def flights_in(self, bbox, start=None, end=None):
+        """
+        Flights that passed through ``bbox`` during the window, with the first
+        and last index time seen in the matching cells.
+        """
+        hits = self.candidates(bbox, start, end)
+        table = pa.table({
+            "flight_id": self.flights[hits],
+            "date": self.dates[hits],
+            "start": self.start[hits],
+            "end": self.end[hits],
+        })
+        summary = table.group_by(["flight_id", "date"]).aggregate([("start", "min"), ("end", "max")])
+        summary = summary.select(["flight_id", "date", "start_min", "end_max"])
+        return summary.rename_columns(["flight_id", "date", "first_seen", "last_seen"]).sort_by("first_seen")
+
+    def query(self, bbox, start=None, end=None, max_gap=30.0, tolerance=None, **track_options):
+        """
+        Return the track segments inside ``bbox`` during [start, end].
+
+        Only the ``date`` partitions of candidate flights are read, and the
+        fixes are filtered to the box and window while scanning. A flight that
+        leaves the box and comes back yields one segment per pass.
+
+        Segments keep every fix by default. Pass a ``tolerance`` in metres to
+        Douglas-Peucker simplify them; that dominates the query time for large
+        boxes (seconds for millions of fixes).
+        """
+        hits = self.candidates(bbox, start, end)
+        if not len(hits):
+            return build_tracks(np.empty(0), np.empty(0), np.empty(0))
+
+        min_lon, min_lat, max_lon, max_lat = bbox
+        condition = (
+            ds.field("date").isin(np.unique(self.dates[hits]).tolist())
+            & ds.field("flight_id").isin(np.unique(self.flights[hits]).tolist())
+            & (ds.field("longitude") >= min_lon) & (ds.field("longitude") <= max_lon)
+            & (ds.field("latitude") >= min_lat) & (ds.field("latitude") <= max_lat)
+        )
+        if start is not None:
+            condition &= ds.field("time") >= pa.scalar(np.datetime64(start, "ms"))
+        if end is not None:
+            condition &= ds.field("time") <= pa.scalar(np.datetime64(end, "ms"))
+
+        fixes = open_flight_archive(self.archive_path).to_table(
+            columns=["flight_id", "time", "latitude", "longitude", "altitude"], filter=condition,
+        )
+        fixes = fixes.sort_by([("flight_id", "ascending"), ("time", "ascending")])
+        # Time between consecutive in-box fixes marks where a flight left the box
+        return build_tracks(
+            pc.cast(fixes["time"], pa.int64()).to_numpy() / 1000.0,
+            fixes["latitude"].to_numpy(),
+            fixes["longitude"].to_numpy(),
+            altitude=fixes["altitude"].to_numpy(),
+            flight_ids=fixes["flight_id"].to_numpy(),
+            max_gap=max_gap,
+            tolerance=tolerance,
+            **track_options,
+        )
+
+
+def _empty_entries():
+    return pa.table({
+        "cell": pa.array([], pa.int64()),
+        "date": pa.array([], pa.string()),
+        "flight_id": pa.array([], pa.string()),
+        "start": pa.array([], pa.int64()),
+        "end": pa.array([], pa.int64()),
+    })
+
+
+def _aggregate(table, start_column, end_column):
+    grouped = table.group_by(["cell", "date", "flight_id"]).aggregate([
+        (start_column, "min"), (end_column, "max"),
+    ])
+    # Select by name: the position of the key columns differs between pyarrow versions
+    grouped = grouped.select(["cell", "date", "flight_id", f"{start_column}_min", f"{end_column}_max"])
+    return grouped.rename_columns(["cell", "date", "flight_id", "start", "end"])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from savanna_loader import read_zone_sheet, to_wide
+
+# The two header layouts shown in Data_ANALYSIS.ipynb
+CROP_SHEET = """\
+,Rice,,,Maize,,
+Year,Guinea,Sudan,Sahel,Guinea,Sudan,Sahel
+1994,67.0,58.6,31.8,202.6,145.4,281.6
+1995,246.3,43.1,31.2,165.1,132.6,267.1
+"""
+INDICATOR_SHEET = """\
+Years,SPEI,SPEI,SPEI,NDVI,NDVI,NDVI
+,Guinea,Sudan,Sahel,Guinea,Sudan,Sahel
+1994,-0.628,-0.829,-0.54,0.172,0.142,0.149
+1995,-0.654,-1.396,-0.954,0.234,0.186,0.208
+"""
+
+
+@pytest.mark.parametrize("text, first, variables", [
+    (CROP_SHEET, "Rice_Guinea", {"Rice", "Maize"}),
+    (INDICATOR_SHEET, "SPEI_Guinea", {"SPEI", "NDVI"}),
+])
+def test_read_zone_sheet_header_layouts(tmp_path, text, first, variables):
+    path = tmp_path / "sheet.csv"
+    path.write_text(text)
+
+    tidy = read_zone_sheet(str(path))
+
+    assert len(tidy) == 12
+    assert set(tidy["Variable"]) == variables
+    assert set(tidy["Zone"]) == {"Guinea", "Sudan", "Sahel"}
+    wide = to_wide(tidy)
+    assert wide["Year"].tolist() == [1994, 1995]
+    expected = float(text.splitlines()[2].split(",")[1])
+    assert np.isclose(wide[first].iloc[0], expected)
+
+
+def test_read_zone_sheet_without_year_column(tmp_path):
+    path = tmp_path / "sheet.csv"
+    path.write_text(",Rice\nZone,Guinea\n1994,67.0\n")
+
+    with pytest.raises(ValueError, match="Year"):
+        read_zone_sheet(str(path))